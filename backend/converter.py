@@ -5,6 +5,9 @@ Converts PDF, DOCX, TXT, EPUB, and images to structured JSON for AI comprehensio
 Focus: Speed, accuracy, memory efficiency, AI-ready output format, and semantic cleanup
 """
 
+import functools
+import importlib
+import itertools
 import io
 import json
 import logging
@@ -18,14 +21,15 @@ import tempfile
 import shutil
 import argparse
 import signal
-from collections import Counter, defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Tuple, Set, Iterator, Generator
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Union, Any, Tuple, Set, Iterable, Iterator, Generator
 from enum import Enum
-import hashlib
 
 # Configure logging with color support for console
 try:
@@ -74,89 +78,55 @@ logger.info(f"Document Converter v{__version__} initializing")
 DEPENDENCIES = {
     'core': ['fitz', 'PIL', 'pytesseract', 'docx'],
     'enhanced': ['nltk', 'langdetect', 'ebooklib', 'pdf2image'],
-    'optional': ['magic', 'colorama']
+    'optional': ['magic', 'colorama', 'orjson', 'tesserocr', 'charset_normalizer']
 }
 
 # Dictionary to track available modules
 available_modules = {}
 
-# Core dependencies
-try:
-    import fitz  # PyMuPDF
-    available_modules['fitz'] = True
-except ImportError as e:
-    logger.warning(f"PyMuPDF not available - PDF processing disabled: {e}")
-    available_modules['fitz'] = False
-
-try:
-    from PIL import Image, ImageOps, ImageEnhance, ImageFilter
-    available_modules['PIL'] = True
-except ImportError as e:
-    logger.warning(f"Pillow not available - Image processing disabled: {e}")
-    available_modules['PIL'] = False
-
-try:
-    import pytesseract
-    available_modules['pytesseract'] = True
-except ImportError as e:
-    logger.warning(f"pytesseract not available - OCR disabled: {e}")
-    available_modules['pytesseract'] = False
+# Heavy dependencies are imported on first use so that importing this module
+# (e.g. in every server worker) does not pay for NLTK, PyMuPDF, etc. up front.
+# Maps module name -> (dependency key, log level, message when unavailable)
+_LAZY_MODULES = {
+    'fitz': ('fitz', logging.WARNING, "PyMuPDF not available - PDF processing disabled"),
+    'PIL.Image': ('PIL', logging.WARNING, "Pillow not available - Image processing disabled"),
+    'PIL.ImageOps': ('PIL', logging.WARNING, "Pillow not available - Image processing disabled"),
+    'PIL.ImageEnhance': ('PIL', logging.WARNING, "Pillow not available - Image processing disabled"),
+    'pytesseract': ('pytesseract', logging.WARNING, "pytesseract not available - OCR disabled"),
+    'tesserocr': ('tesserocr', logging.DEBUG, "tesserocr not available. OCR will run through pytesseract."),
+    'docx': ('docx', logging.WARNING, "python-docx not available - DOCX processing disabled"),
+    'nltk': ('nltk', logging.WARNING, "NLTK not available. Topic extraction will be limited."),
+    'nltk.corpus': ('nltk', logging.WARNING, "NLTK not available. Topic extraction will be limited."),
+    'langdetect': ('langdetect', logging.WARNING, "langdetect not available. Automatic language detection will be disabled."),
+    'ebooklib': ('ebooklib', logging.WARNING, "ebooklib or html2text not available. EPUB processing will be disabled."),
+    'ebooklib.epub': ('ebooklib', logging.WARNING, "ebooklib or html2text not available. EPUB processing will be disabled."),
+    'html2text': ('ebooklib', logging.WARNING, "ebooklib or html2text not available. EPUB processing will be disabled."),
+    'pdf2image': ('pdf2image', logging.WARNING, "pdf2image not available. Alternative OCR pipeline will be disabled."),
+    'magic': ('magic', logging.DEBUG, "python-magic not available. Will rely on file extensions for type detection."),
+    'charset_normalizer': ('charset_normalizer', logging.DEBUG, "charset-normalizer not available. Non-UTF-8 text will be decoded by trial."),
+}
 
-try:
-    from docx import Document as DocxDocument
-    available_modules['docx'] = True
-except ImportError as e:
-    logger.warning(f"python-docx not available - DOCX processing disabled: {e}")
-    available_modules['docx'] = False
 
-# Enhanced dependencies
-try:
-    import nltk
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt', quiet=True)
+@functools.cache
+def _lazy_import(name: str) -> Optional[Any]:
+    """Import an optional module on first access, returning None if it is missing"""
+    key, level, message = _LAZY_MODULES[name]
     try:
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('stopwords', quiet=True)
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    available_modules['nltk'] = True
-except ImportError:
-    logger.warning("NLTK not available. Topic extraction will be limited.")
-    available_modules['nltk'] = False
+        module = importlib.import_module(name)
+    except ImportError as e:
+        logger.log(level, f"{message}: {e}")
+        available_modules[key] = False
+        return None
+    available_modules.setdefault(key, True)
+    return module
 
-try:
-    from langdetect import detect as detect_language
-    available_modules['langdetect'] = True
-except ImportError:
-    logger.warning("langdetect not available. Automatic language detection will be disabled.")
-    available_modules['langdetect'] = False
 
 try:
-    import ebooklib
-    from ebooklib import epub
-    import html2text
-    available_modules['ebooklib'] = True
+    import orjson
+    available_modules['orjson'] = True
 except ImportError:
-    logger.warning("ebooklib or html2text not available. EPUB processing will be disabled.")
-    available_modules['ebooklib'] = False
-
-try:
-    import pdf2image
-    available_modules['pdf2image'] = True
-except ImportError:
-    logger.warning("pdf2image not available. Alternative OCR pipeline will be disabled.")
-    available_modules['pdf2image'] = False
-
-# Optional dependencies
-try:
-    import magic
-    available_modules['magic'] = True
-except ImportError:
-    logger.debug("python-magic not available. Will rely on file extensions for type detection.")
-    available_modules['magic'] = False
+    logger.debug("orjson not available. Falling back to the standard json module for output.")
+    available_modules['orjson'] = False
 
 
 class ContentType(Enum):
@@ -172,7 +142,7 @@ class ContentType(Enum):
     EQUATION = "equation"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
     """Structured content block for AI consumption"""
     type: str
@@ -190,113 +160,249 @@ class ContentBlock:
         }
 
 
-class ContentNormalizer:
-    """Advanced content normalizer for semantic cleanup and structure improvement"""
+# Normalizer patterns are compiled once at import and shared by every instance
+_HEADING_PATTERNS: Dict[str, re.Pattern] = {
+    'chapter_variations': re.compile(r'^(Chapter|CHAPTER|Ch\.?|chapter)\s*(\d+|[IVXLCDM]+)[\s:\-]*(.*)$', re.IGNORECASE),
+    'section_variations': re.compile(r'^(Section|SECTION|Sec\.?|section)\s*(\d+(?:\.\d+)*)[\s:\-]*(.*)$', re.IGNORECASE),
+    'part_variations': re.compile(r'^(Part|PART|part)\s*(\d+|[IVXLCDM]+)[\s:\-]*(.*)$', re.IGNORECASE),
+    'lab_step': re.compile(r'^(Lab|LAB|Step|STEP)\s*(\d+)[\s:\-]*(.*)$', re.IGNORECASE),
+    'exercise': re.compile(r'^(Exercise|EXERCISE|Ex\.?)\s*(\d+)[\s:\-]*(.*)$', re.IGNORECASE),
+    'duplicate_heading': re.compile(r'^(.+?)\s*\1\s*$', re.IGNORECASE),
+    'placeholder_heading': re.compile(r'^[\[\(]?\s*(placeholder|todo|tbd|xxx|fixme)\s*[\]\)]?$', re.IGNORECASE)
+}
+# Section-style heading forms tried in order by _normalize_heading
+_HEADING_VARIATION_PATTERNS: Tuple[re.Pattern, ...] = tuple(
+    pattern for name, pattern in _HEADING_PATTERNS.items() if name.endswith('_variations')
+)
+_DUPLICATE_HEADING_RE = _HEADING_PATTERNS['duplicate_heading']
+
+_LANGUAGE_PATTERNS: Dict[str, re.Pattern] = {
+    'bash': re.compile(r'(?:#!/bin/bash|#!/bin/sh|\$\s+|sudo\s+|chmod\s+|grep\s+|awk\s+|sed\s+|ls\s+|cd\s+|mkdir\s+)', re.IGNORECASE),
+    'powershell': re.compile(r'(?:PS\s*>|Get-|Set-|New-|Remove-|\$\w+\s*=|Import-Module|cmdlet)', re.IGNORECASE),
+    'python': re.compile(r'(?:#!/usr/bin/python|import\s+\w+|from\s+\w+\s+import|def\s+\w+|class\s+\w+|print\()', re.IGNORECASE),
+    'javascript': re.compile(r'(?:function\s+\w+|var\s+\w+|let\s+\w+|const\s+\w+|console\.log|require\()', re.IGNORECASE),
+    'sql': re.compile(r'(?:SELECT\s+|FROM\s+|WHERE\s+|INSERT\s+INTO|UPDATE\s+|DELETE\s+FROM|CREATE\s+TABLE)', re.IGNORECASE),
+    'yaml': re.compile(r'(?:^[\s]*[\w\-]+:\s*$|^[\s]*-\s+[\w\-]+:|version:\s*[\d\.]+)', re.MULTILINE),
+    'json': re.compile(r'(?:^\s*[\{\[]|"[\w\-]+"\s*:\s*|^\s*[\}\]])', re.MULTILINE),
+    'dockerfile': re.compile(r'(?:FROM\s+|RUN\s+|COPY\s+|ADD\s+|WORKDIR\s+|EXPOSE\s+)', re.IGNORECASE),
+    'xml': re.compile(r'(?:<\?xml|<[\w\-]+[^>]*>|</[\w\-]+>)', re.IGNORECASE),
+    'css': re.compile(r'(?:[\w\-]+\s*\{|[\w\-]+:\s*[\w\-#]+;|\.[a-zA-Z][\w\-]*\s*\{)', re.IGNORECASE)
+}
 
-    def __init__(self):
-        self.url_cache = set()
-        self.heading_patterns = self._compile_heading_patterns()
-        self.language_patterns = self._compile_language_patterns()
-        self.placeholder_patterns = self._compile_placeholder_patterns()
+_PLACEHOLDER_RE = re.compile(
+    r'^[\[\(]?\s*(?:placeholder|todo|tbd|xxx|fixme|coming\s+soon)\s*[\]\)]?$'
+    r'|^[\-_=]{10,}$'
+    r'|^\.{10,}$'
+    r'|^\s*\.\s*\.\s*\.\s*$',
+    re.IGNORECASE
+)
+
+# Tool and step vocabulary that marks a block as a semantic list
+_LIST_INDICATOR_RE = re.compile(r'tool|software|application|utility|command|package|step|phase|stage|procedure|process')
+
+_CHECKLIST_RE = re.compile(
+    r'^\s*[\-\*\+•]\s*\w+'
+    r'|^\s*\d+[\.\)]\s*\w+'
+    r'|^\s*[A-Z][a-z]+:\s*'
+    r'|^\s*\w+\s*-\s*\w+'
+)
+
+_BULLET_PREFIX_RE = re.compile(r'^[\-\*\+•]\s*')
+_NUMBERED_PREFIX_RE = re.compile(r'^\d+[\.\)]\s*')
+_ORDINAL_PREFIX_RE = re.compile(r'^(first|second|third|next|then|finally)[\s,]*', re.IGNORECASE)
+_ORDINAL_STARTS = ('first', 'second', 'third', 'next', 'then', 'finally')
+_ORDINAL_PREFIX_LENGTH = max(map(len, _ORDINAL_STARTS))
+_SENTENCE_END_TABLE = str.maketrans('!?', '..')
+# Shell, PowerShell and user@host prompts, stripped in that order from the start
+# of every line in one pass. [^\S\n] keeps whitespace matches within a line.
+_CMD_PROMPT_RE = re.compile(
+    r'^(?:[\$#][^\S\n]*)?(?:PS[^\S\n]*>[^\S\n]*)?(?:\w+@\w+:\w*\$[^\S\n]*)?',
+    re.MULTILINE
+)
+# _clean_url rewrites are plain prefix/suffix checks, no regex needed
+_URL_TRAILING_PUNCT = '.,;:!?])'
+_WEB_SCHEMES = ('http://', 'https://')
+
+# Deletes code punctuation; a length change means the text contains some
+_CODE_CHAR_DELETE_TABLE = str.maketrans('', '', '{}();=')
+
+_JSON_OPEN_RE = re.compile(r'^\s*[\{\[]', re.MULTILINE)
+
+
+def _scoped_pattern(pattern: re.Pattern) -> str:
+    """Wrap a compiled pattern's source in a group carrying its own flags"""
+    flags = ''.join(letter for flag, letter in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'))
+                    if pattern.flags & flag)
+    return f'(?{flags}:{pattern.pattern})' if flags else pattern.pattern
+
+
+# All language signatures in one scan. Each branch is a lookahead so matches do
+# not consume text, and a branch's position in the dict is its priority: at any
+# offset the earliest listed language wins, as with the original sequential loop.
+_LANGUAGE_PRIORITY = {language: rank for rank, language in enumerate(_LANGUAGE_PATTERNS)}
+_LANGUAGE_COMBINED_RE = re.compile('|'.join(
+    f'(?=(?P<{language}>{_scoped_pattern(pattern)}))' for language, pattern in _LANGUAGE_PATTERNS.items()
+))
+
+# Language signatures appear early in a snippet, so detection only samples the
+# head of each code block; this also bounds the memory held by the cache below
+LANGUAGE_SAMPLE_CHARS = 512
+
+
+@functools.lru_cache(maxsize=2048)
+def _detect_language(code: str) -> Optional[str]:
+    """Detect programming language from a code sample (memoized across blocks)"""
+    if code.startswith('#!/'):
+        shebang = code[:50]
+        if 'python' in shebang:
+            return 'python'
+        elif 'sh' in shebang:  # also covers 'bash'
+            return 'bash'
+
+    detected, best_rank = None, len(_LANGUAGE_PRIORITY)
+    for match in _LANGUAGE_COMBINED_RE.finditer(code):
+        rank = _LANGUAGE_PRIORITY[match.lastgroup]
+        if rank < best_rank:
+            detected, best_rank = match.lastgroup, rank
+            if rank == 0:
+                break
+    if detected:
+        return detected
 
-    def _compile_heading_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile patterns for heading normalization"""
-        return {
-            'chapter_variations': re.compile(r'^(Chapter|CHAPTER|Ch\.?|chapter)\s*(\d+|[IVXLCDM]+)[\s:\-]*(.*)$', re.IGNORECASE),
-            'section_variations': re.compile(r'^(Section|SECTION|Sec\.?|section)\s*(\d+(?:\.\d+)*)[\s:\-]*(.*)$', re.IGNORECASE),
-            'part_variations': re.compile(r'^(Part|PART|part)\s*(\d+|[IVXLCDM]+)[\s:\-]*(.*)$', re.IGNORECASE),
-            'lab_step': re.compile(r'^(Lab|LAB|Step|STEP)\s*(\d+)[\s:\-]*(.*)$', re.IGNORECASE),
-            'exercise': re.compile(r'^(Exercise|EXERCISE|Ex\.?)\s*(\d+)[\s:\-]*(.*)$', re.IGNORECASE),
-            'duplicate_heading': re.compile(r'^(.+?)\s*\1\s*$', re.IGNORECASE),
-            'placeholder_heading': re.compile(r'^[\[\(]?\s*(placeholder|todo|tbd|xxx|fixme)\s*[\]\)]?$', re.IGNORECASE)
-        }
+    lowered = code.lower()
+    if 'select ' in lowered or 'from ' in lowered or 'where ' in lowered:
+        return 'sql'
+    elif code.strip().startswith(('<?xml', '<html', '<!')):
+        return 'xml'
+    elif _JSON_OPEN_RE.search(code) and '"' in code:
+        return 'json'
 
-    def _compile_language_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile patterns for programming language detection"""
-        return {
-            'bash': re.compile(r'(?:#!/bin/bash|#!/bin/sh|\$\s+|sudo\s+|chmod\s+|grep\s+|awk\s+|sed\s+|ls\s+|cd\s+|mkdir\s+)', re.IGNORECASE),
-            'powershell': re.compile(r'(?:PS\s*>|Get-|Set-|New-|Remove-|\$\w+\s*=|Import-Module|cmdlet)', re.IGNORECASE),
-            'python': re.compile(r'(?:#!/usr/bin/python|import\s+\w+|from\s+\w+\s+import|def\s+\w+|class\s+\w+|print\()', re.IGNORECASE),
-            'javascript': re.compile(r'(?:function\s+\w+|var\s+\w+|let\s+\w+|const\s+\w+|console\.log|require\()', re.IGNORECASE),
-            'sql': re.compile(r'(?:SELECT\s+|FROM\s+|WHERE\s+|INSERT\s+INTO|UPDATE\s+|DELETE\s+FROM|CREATE\s+TABLE)', re.IGNORECASE),
-            'yaml': re.compile(r'(?:^[\s]*[\w\-]+:\s*$|^[\s]*-\s+[\w\-]+:|version:\s*[\d\.]+)', re.MULTILINE),
-            'json': re.compile(r'(?:^\s*[\{\[]|"[\w\-]+"\s*:\s*|^\s*[\}\]])', re.MULTILINE),
-            'dockerfile': re.compile(r'(?:FROM\s+|RUN\s+|COPY\s+|ADD\s+|WORKDIR\s+|EXPOSE\s+)', re.IGNORECASE),
-            'xml': re.compile(r'(?:<\?xml|<[\w\-]+[^>]*>|</[\w\-]+>)', re.IGNORECASE),
-            'css': re.compile(r'(?:[\w\-]+\s*\{|[\w\-]+:\s*[\w\-#]+;|\.[a-zA-Z][\w\-]*\s*\{)', re.IGNORECASE)
-        }
+    return 'text'
+
+
+@functools.lru_cache(maxsize=16384)
+def _normalize_url(url: str) -> str:
+    """Clean and normalize a URL (memoized, links repeat heavily across documents)"""
+    url = url.strip().rstrip(_URL_TRAILING_PUNCT)
+    if url.startswith(_WEB_SCHEMES):
+        rest = url.partition('://')[2]
+        if rest.startswith(_WEB_SCHEMES):
+            url = 'https://' + rest.partition('://')[2]
+    elif url.startswith('www.'):
+        url = 'https://' + url
+
+    if not url.startswith(('http://', 'https://', 'ftp://', 'mailto:')):
+        if '.' in url and not url.startswith('/'):
+            url = f'https://{url}'
+
+    return url
+
+
+def _split_sentences(content: str) -> List[str]:
+    """Split on runs of '.', '!' and '?' exactly like re.split(r'[.!?]+', content)"""
+    pieces = content.translate(_SENTENCE_END_TABLE).split('.')
+    if len(pieces) < 3:
+        return pieces
+    # Consecutive terminators leave empty interior pieces that the regex would collapse
+    return [pieces[0], *filter(None, pieces[1:-1]), pieces[-1]]
+
+
+# Below this many blocks, process start-up and pickling cost more than the
+# per-block regex work saves, so normalization stays in-process
+PARALLEL_NORMALIZE_MIN_BLOCKS = 2000
 
-    def _compile_placeholder_patterns(self) -> List[re.Pattern]:
-        """Compile patterns for placeholder detection"""
-        return [
-            re.compile(r'^[\[\(]?\s*(placeholder|todo|tbd|xxx|fixme|coming\s+soon)\s*[\]\)]?$', re.IGNORECASE),
-            re.compile(r'^[\-_=]{10,}$'),
-            re.compile(r'^\.{10,}$'),
-            re.compile(r'^\s*\.\s*\.\s*\.\s*$')
-        ]
+# Upper bound on remembered URLs; least recently seen ones are evicted first
+URL_CACHE_MAX_ENTRIES = 100_000
+
+
+def _normalize_block_chunk(blocks: List['ContentBlock']) -> List[Optional['ContentBlock']]:
+    """Normalize a slice of blocks independently (process pool worker)"""
+    normalizer = ContentNormalizer()
+    return [normalizer._normalize_individual_block(block) for block in blocks]
+
+
+class ContentNormalizer:
+    """Advanced content normalizer for semantic cleanup and structure improvement"""
+
+    def __init__(self, workers: int = 1):
+        self.workers = max(1, workers)
+        self.url_cache: 'OrderedDict[str, None]' = OrderedDict()
+        self.heading_patterns = _HEADING_PATTERNS
+        self.language_patterns = _LANGUAGE_PATTERNS
+        self.placeholder_pattern = _PLACEHOLDER_RE
+        self._dispatch = {
+            ContentType.HEADING.value: self._normalize_heading,
+            ContentType.CODE_BLOCK.value: self._normalize_code_block,
+            ContentType.LIST.value: self._normalize_list,
+            ContentType.PARAGRAPH.value: self._normalize_paragraph,
+        }
 
     def normalize_content_blocks(self, blocks: List[ContentBlock]) -> List[ContentBlock]:
         """Apply comprehensive normalization to content blocks"""
         logger.info("Starting content normalization and semantic cleanup")
 
-        # Phase 1: Clean individual blocks
-        cleaned_blocks = []
-        for block in blocks:
-            normalized_block = self._normalize_individual_block(block)
-            if normalized_block:
-                cleaned_blocks.append(normalized_block)
-
-        # Phase 2: Structural improvements
-        structured_blocks = self._improve_structure(cleaned_blocks)
-
-        # Phase 3: Deduplicate and merge similar content
-        final_blocks = self._deduplicate_content(structured_blocks)
+        # Cleanup, structural improvements and deduplication are chained
+        # generators, so blocks are traversed once without intermediate lists
+        seen_content = set()
+        structured_blocks = self._iter_structured_blocks(self._normalize_blocks(blocks))
+        final_blocks = [block for block in structured_blocks if not self._is_duplicate(block, seen_content)]
 
         logger.info(f"Normalization complete: {len(blocks)} -> {len(final_blocks)} blocks")
         return final_blocks
 
+    def _normalize_blocks(self, blocks: List[ContentBlock]) -> Iterator[ContentBlock]:
+        """Normalize blocks one by one, fanning out to worker processes for large inputs"""
+        if self.workers == 1 or len(blocks) < PARALLEL_NORMALIZE_MIN_BLOCKS:
+            normalized_blocks = map(self._normalize_individual_block, blocks)
+        else:
+            chunk_size = -(-len(blocks) // self.workers)
+            chunks = [blocks[i:i + chunk_size] for i in range(0, len(blocks), chunk_size)]
+            logger.debug(f"Normalizing {len(blocks)} blocks across {len(chunks)} worker processes")
+
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                normalized_blocks = [block for chunk in executor.map(_normalize_block_chunk, chunks) for block in chunk]
+
+        for block in normalized_blocks:
+            if block:
+                self._filter_seen_urls(block)
+                yield block
+
     def _normalize_individual_block(self, block: ContentBlock) -> Optional[ContentBlock]:
         """Normalize a single content block"""
-        if not block.content.strip():
+        content = block.content.strip()
+        if not content:
             return None
+        # Handlers receive and leave behind stripped content
+        block.content = content
 
-        if block.type == ContentType.HEADING.value:
-            return self._normalize_heading(block)
-        elif block.type == ContentType.CODE_BLOCK.value:
-            return self._normalize_code_block(block)
-        elif block.type == ContentType.LIST.value:
-            return self._normalize_list(block)
-        elif block.type == ContentType.PARAGRAPH.value:
-            return self._normalize_paragraph(block)
-        else:
-            return block
+        handler = self._dispatch.get(block.type)
+        return handler(block) if handler else block
 
     def _normalize_heading(self, block: ContentBlock) -> Optional[ContentBlock]:
         """Normalize heading blocks"""
-        content = block.content.strip()
+        content = block.content
 
-        if any(pattern.match(content) for pattern in self.placeholder_patterns):
+        if self.placeholder_pattern.match(content):
             return None
 
-        for pattern_name, pattern in self.heading_patterns.items():
-            if pattern_name.endswith('_variations'):
-                match = pattern.match(content)
-                if match:
-                    prefix = match.group(1).title()
-                    number = match.group(2)
-                    title = match.group(3).strip() if len(match.groups()) > 2 else ""
+        for pattern in _HEADING_VARIATION_PATTERNS:
+            match = pattern.match(content)
+            if match:
+                prefix = match.group(1).title()
+                number = match.group(2)
+                title = match.group(3).strip() if len(match.groups()) > 2 else ""
 
-                    if title:
-                        block.content = f"{prefix} {number}: {title}"
-                    else:
-                        block.content = f"{prefix} {number}"
+                if title:
+                    block.content = f"{prefix} {number}: {title}"
+                else:
+                    block.content = f"{prefix} {number}"
 
-                    block.metadata['section_type'] = prefix.lower()
-                    block.metadata['section_number'] = number
-                    block.metadata['normalized'] = True
-                    break
+                block.metadata['section_type'] = prefix.lower()
+                block.metadata['section_number'] = number
+                block.metadata['normalized'] = True
+                break
 
-        duplicate_match = self.heading_patterns['duplicate_heading'].match(content)
+        duplicate_match = _DUPLICATE_HEADING_RE.match(content)
         if duplicate_match:
             block.content = duplicate_match.group(1).strip()
             block.metadata['had_duplicate'] = True
@@ -309,9 +415,9 @@ class ContentNormalizer:
 
     def _normalize_code_block(self, block: ContentBlock) -> Optional[ContentBlock]:
         """Normalize and enhance code blocks"""
-        content = block.content.strip()
+        content = block.content
 
-        if len(content) < 10 and not any(char in content for char in ['{', '}', '(', ')', ';', '=']):
+        if len(content) < 10 and len(content.translate(_CODE_CHAR_DELETE_TABLE)) == len(content):
             return ContentBlock(
                 type=ContentType.HEADING.value,
                 content=content,
@@ -325,24 +431,23 @@ class ContentNormalizer:
             block.metadata['language_confidence'] = 'detected'
 
         if detected_language in ['bash', 'powershell']:
-            content = self._clean_command_line_content(content)
-            block.content = content
+            block.content = self._clean_command_line_content(content).strip()
 
         return block
 
     def _normalize_list(self, block: ContentBlock) -> Optional[ContentBlock]:
         """Normalize list blocks"""
-        content = block.content.strip()
+        content = block.content
         lines = content.split('\n')
 
-        if self._is_semantic_list(lines):
+        if self._is_semantic_list(lines, content):
             block.metadata['semantic_list'] = True
             normalized_items = []
             for line in lines:
                 line = line.strip()
                 if line:
-                    clean_line = re.sub(r'^[\-\*\+•]\s*', '', line)
-                    clean_line = re.sub(r'^\d+[\.\)]\s*', '', clean_line)
+                    clean_line = _BULLET_PREFIX_RE.sub('', line)
+                    clean_line = _NUMBERED_PREFIX_RE.sub('', clean_line)
                     normalized_items.append(clean_line)
 
             block.content = '\n'.join(normalized_items)
@@ -352,16 +457,12 @@ class ContentNormalizer:
 
     def _normalize_paragraph(self, block: ContentBlock) -> Optional[ContentBlock]:
         """Normalize paragraph blocks"""
-        content = block.content.strip()
+        content = block.content
 
         if 'urls' in block.metadata:
-            cleaned_urls = []
-            for url in block.metadata['urls']:
-                clean_url = self._clean_url(url)
-                if clean_url and clean_url not in self.url_cache:
-                    cleaned_urls.append(clean_url)
-                    self.url_cache.add(clean_url)
-            block.metadata['urls'] = cleaned_urls
+            # Repeated links are cleaned once; duplicates are dropped by _filter_seen_urls anyway
+            cleaned_urls = map(self._clean_url, dict.fromkeys(block.metadata['urls']))
+            block.metadata['urls'] = [url for url in cleaned_urls if url]
 
         if self._should_convert_to_list(content):
             list_items = self._extract_list_items(content)
@@ -378,116 +479,90 @@ class ContentNormalizer:
                     }
                 )
 
-        block.content = content
         return block
 
+    def _filter_seen_urls(self, block: ContentBlock):
+        """Drop paragraph URLs already reported by an earlier block"""
+        if 'urls' not in block.metadata:
+            return
+        if (block.type != ContentType.PARAGRAPH.value and
+                block.metadata.get('converted_from') != 'paragraph'):
+            return
+
+        unseen_urls = []
+        for url in block.metadata['urls']:
+            if url in self.url_cache:
+                self.url_cache.move_to_end(url)
+                continue
+            unseen_urls.append(url)
+            self.url_cache[url] = None
+            if len(self.url_cache) > URL_CACHE_MAX_ENTRIES:
+                self.url_cache.popitem(last=False)
+        block.metadata['urls'] = unseen_urls
+
     def _detect_programming_language(self, code: str) -> Optional[str]:
         """Detect programming language from code content"""
-        if code.startswith('#!/'):
-            if 'python' in code[:50]:
-                return 'python'
-            elif any(shell in code[:50] for shell in ['bash', 'sh']):
-                return 'bash'
-
-        for language, pattern in self.language_patterns.items():
-            if pattern.search(code):
-                return language
-
-        if any(keyword in code.lower() for keyword in ['select ', 'from ', 'where ']):
-            return 'sql'
-        elif code.strip().startswith(('<?xml', '<html', '<!')):
-            return 'xml'
-        elif re.search(r'^\s*[\{\[]', code, re.MULTILINE) and '"' in code:
-            return 'json'
-
-        return 'text'
+        return _detect_language(code[:LANGUAGE_SAMPLE_CHARS])
 
     def _clean_command_line_content(self, content: str) -> str:
         """Clean command line artifacts from code blocks"""
-        lines = content.split('\n')
-        cleaned_lines = []
-
-        for line in lines:
-            line = re.sub(r'^[\$#]\s*', '', line)
-            line = re.sub(r'^PS\s*>\s*', '', line)
-            line = re.sub(r'^\w+@\w+:\w*\$\s*', '', line)
-            cleaned_lines.append(line)
-
-        return '\n'.join(cleaned_lines)
+        return _CMD_PROMPT_RE.sub('', content)
 
     def _clean_url(self, url: str) -> str:
         """Clean and normalize URLs"""
         if not url:
             return ""
+        return _normalize_url(url)
 
-        url = re.sub(r'[.,;:!?\]\)]+$', '', url.strip())
-        url = re.sub(r'^https?://https?://', 'https://', url)
-        url = re.sub(r'^www\.', 'https://www.', url)
-
-        if not url.startswith(('http://', 'https://', 'ftp://', 'mailto:')):
-            if '.' in url and not url.startswith('/'):
-                url = f'https://{url}'
-
-        return url
-
-    def _is_semantic_list(self, lines: List[str]) -> bool:
+    def _is_semantic_list(self, lines: List[str], text: Optional[str] = None) -> bool:
         """Detect if content should be formatted as a semantic list"""
         if len(lines) < 2:
             return False
 
-        tool_indicators = ['tool', 'software', 'application', 'utility', 'command', 'package']
-        if any(indicator in '\n'.join(lines).lower() for indicator in tool_indicators):
+        # Callers that split the text themselves pass it along to skip the re-join
+        if text is None:
+            text = '\n'.join(lines)
+        if _LIST_INDICATOR_RE.search(text.lower()):
             return True
 
-        step_indicators = ['step', 'phase', 'stage', 'procedure', 'process']
-        if any(indicator in '\n'.join(lines).lower() for indicator in step_indicators):
-            return True
-
-        checklist_patterns = [
-            r'^\s*[\-\*\+•]\s*\w+',
-            r'^\s*\d+[\.\)]\s*\w+',
-            r'^\s*[A-Z][a-z]+:\s*',
-            r'^\s*\w+\s*-\s*\w+'
-        ]
-
-        pattern_matches = 0
-        for line in lines:
-            if any(re.match(pattern, line) for pattern in checklist_patterns):
-                pattern_matches += 1
+        pattern_matches = sum(1 for line in lines if _CHECKLIST_RE.match(line))
 
         return pattern_matches >= len(lines) * 0.6
 
     def _should_convert_to_list(self, content: str) -> bool:
         """Check if paragraph content should be converted to a list"""
-        sentences = re.split(r'[.!?]+', content)
+        sentences = _split_sentences(content)
         if len(sentences) < 3:
             return False
 
         list_indicators = 0
+        non_empty = 0
         for sentence in sentences:
             sentence = sentence.strip()
             if not sentence:
                 continue
+            non_empty += 1
 
-            if (sentence.lower().startswith(('first', 'second', 'third', 'next', 'then', 'finally')) or
-                re.match(r'^\d+[\.\)]\s*', sentence) or
+            # Only the prefix can match, so only the prefix is lowercased
+            if (sentence[:_ORDINAL_PREFIX_LENGTH].lower().startswith(_ORDINAL_STARTS) or
+                _NUMBERED_PREFIX_RE.match(sentence) or
                 sentence.startswith(('- ', '* ', '• ')) or
-                ': ' in sentence and len(sentence.split(':')) == 2):
+                ': ' in sentence and sentence.count(':') == 1):
                 list_indicators += 1
 
-        return list_indicators >= len([s for s in sentences if s.strip()]) * 0.5
+        return list_indicators >= non_empty * 0.5
 
     def _extract_list_items(self, content: str) -> List[str]:
         """Extract list items from paragraph content"""
         items = []
-        sentences = re.split(r'[.!?]+', content)
+        sentences = _split_sentences(content)
 
         for sentence in sentences:
             sentence = sentence.strip()
             if sentence and len(sentence) > 5:
-                sentence = re.sub(r'^(first|second|third|next|then|finally)[\s,]*', '', sentence, flags=re.IGNORECASE)
-                sentence = re.sub(r'^\d+[\.\)]\s*', '', sentence)
-                sentence = re.sub(r'^[\-\*\+•]\s*', '', sentence)
+                sentence = _ORDINAL_PREFIX_RE.sub('', sentence)
+                sentence = _NUMBERED_PREFIX_RE.sub('', sentence)
+                sentence = _BULLET_PREFIX_RE.sub('', sentence)
 
                 if sentence:
                     items.append(sentence.strip())
@@ -496,8 +571,16 @@ class ContentNormalizer:
 
     def _improve_structure(self, blocks: List[ContentBlock]) -> List[ContentBlock]:
         """Improve overall document structure"""
-        improved_blocks = []
+        return list(self._iter_structured_blocks(blocks))
+
+    def _iter_structured_blocks(self, blocks: Iterable[ContentBlock]) -> Iterator[ContentBlock]:
+        """Attach structural context and fold runs of short paragraphs together"""
         current_context = {'chapter': None, 'section': None, 'subsection': None}
+        pending = None
+        # Content folded into `pending` is joined once when the run ends,
+        # rather than re-concatenated on every merge
+        merged_parts = []
+        merged_length = 0
 
         for block in blocks:
             if block.type == ContentType.HEADING.value:
@@ -505,20 +588,35 @@ class ContentNormalizer:
 
             block.metadata['structural_context'] = current_context.copy()
 
-            if (block.type == ContentType.PARAGRAPH.value and
-                improved_blocks and
-                improved_blocks[-1].type == ContentType.PARAGRAPH.value and
-                len(block.content) < 100 and len(improved_blocks[-1].content) < 100):
-
-                improved_blocks[-1].content += " " + block.content
-                if 'urls' in block.metadata:
-                    prev_urls = improved_blocks[-1].metadata.get('urls', [])
-                    improved_blocks[-1].metadata['urls'] = prev_urls + block.metadata['urls']
+            if pending is not None and self._should_merge_paragraphs(pending, block, merged_length):
+                merged_parts.append(block.content)
+                merged_length += 1 + len(block.content)
+                self._merge_paragraph_urls(pending, block)
                 continue
 
-            improved_blocks.append(block)
+            if pending is not None:
+                pending.content = ' '.join(merged_parts)
+                yield pending
+
+            pending = block
+            merged_parts = [block.content]
+            merged_length = len(block.content)
 
-        return improved_blocks
+        if pending is not None:
+            pending.content = ' '.join(merged_parts)
+            yield pending
+
+    def _should_merge_paragraphs(self, previous: ContentBlock, block: ContentBlock, previous_length: int) -> bool:
+        """Check if a short paragraph should be folded into the preceding one"""
+        return (block.type == ContentType.PARAGRAPH.value and
+                previous.type == ContentType.PARAGRAPH.value and
+                len(block.content) < 100 and previous_length < 100)
+
+    def _merge_paragraph_urls(self, previous: ContentBlock, block: ContentBlock):
+        """Carry a merged paragraph's URLs over to the preceding paragraph"""
+        if 'urls' in block.metadata:
+            # _filter_seen_urls gives every paragraph its own list, so extending is safe
+            previous.metadata.setdefault('urls', []).extend(block.metadata['urls'])
 
     def _update_context(self, block: ContentBlock, context: Dict[str, str]):
         """Update structural context based on heading"""
@@ -538,28 +636,26 @@ class ContentNormalizer:
     def _deduplicate_content(self, blocks: List[ContentBlock]) -> List[ContentBlock]:
         """Remove duplicate content blocks"""
         seen_content = set()
-        unique_blocks = []
+        return [block for block in blocks if not self._is_duplicate(block, seen_content)]
 
-        for block in blocks:
-            content_hash = hashlib.md5(block.content.encode('utf-8')).hexdigest()
-
-            if block.type == ContentType.HEADING.value:
-                normalized_content = re.sub(r'\s+', ' ', block.content.lower().strip())
-                semantic_hash = hashlib.md5(normalized_content.encode('utf-8')).hexdigest()
-
-                if semantic_hash in seen_content:
-                    logger.debug(f"Removing duplicate heading: {block.content}")
-                    continue
-                seen_content.add(semantic_hash)
-            else:
-                if content_hash in seen_content:
-                    logger.debug(f"Removing duplicate content block")
-                    continue
-                seen_content.add(content_hash)
+    def _is_duplicate(self, block: ContentBlock, seen_content: Set[str]) -> bool:
+        """Check a block against previously seen content, recording it if new"""
+        # The strings themselves are the keys: str caches its hash, so there is
+        # nothing to encode or digest, and equal keys are exact matches
+        if block.type == ContentType.HEADING.value:
+            normalized_content = ' '.join(block.content.lower().split())
 
-            unique_blocks.append(block)
+            if normalized_content in seen_content:
+                logger.debug(f"Removing duplicate heading: {block.content}")
+                return True
+            seen_content.add(normalized_content)
+        else:
+            if block.content in seen_content:
+                logger.debug(f"Removing duplicate content block")
+                return True
+            seen_content.add(block.content)
 
-        return unique_blocks
+        return False
 
 
 class ProgressTracker:
@@ -572,10 +668,16 @@ class ProgressTracker:
         self.description = description
         self.last_report_time = 0
         self.report_interval = 1.0
+        # Between the first and last item the clock is only read every _check_stride items
+        self._check_stride = max(1, total_items // 1000)
+        self._next_check = self._check_stride
 
     def update(self, items_completed: int = 1) -> None:
         """Update progress and print status if interval elapsed"""
         self.current += items_completed
+        if 1 < self.current < self.total and self.current < self._next_check:
+            return
+        self._next_check = self.current + self._check_stride
         current_time = time.time()
 
         if (self.current == 1 or
@@ -609,11 +711,237 @@ def memory_management():
         gc.collect()
 
 
+# Sections processed between progress updates and young-generation collections
+SECTION_BATCH_SIZE = 256
+
+
+# Below this many sections, worker start-up outweighs the per-section classification work
+PARALLEL_SECTION_MIN_SECTIONS = 1000
+
+
+# Parser patterns are compiled once at import; the mapping is read-only because
+# every DocumentParser shares it
+_PARSER_PATTERNS: Mapping[str, re.Pattern] = MappingProxyType({
+    'heading_hash': re.compile(r'^(#{1,6})\s+(.+)$'),
+    'heading_underline': re.compile(r'^(.+)\n([=\-])\2{2,}$', re.MULTILINE),
+    'heading_numbered': re.compile(r'^(\d+(?:\.\d+)*)\s+(.+)$'),
+    'heading_chapter': re.compile(r'^(Chapter|Section|Part|CHAPTER|SECTION|PART|Ch\.?|Sec\.?)\s*(\d+|[IVXLCDM]+)[\s:\-]*(.*)$', re.IGNORECASE),
+    'code_fence': re.compile(r'^```(\w+)?\n(.*?)^```$', re.MULTILINE | re.DOTALL),
+    'code_indent': re.compile(r'^(    .+)$', re.MULTILINE),
+    'code_line': re.compile(r'^[\$#>]\s*(.+)$'),
+    'bullet_list': re.compile(r'^[\s]*[-\*\+\u2022\u25E6\u25D8\u25CB\u25CF]\s+(.+)$'),
+    'numbered_list': re.compile(r'^[\s]*(\d+|[a-z]|[A-Z]|[ivxlcdm]+|[IVXLCDM]+)[.)\]]\s+(.+)$'),
+    'blockquote': re.compile(r'^>\s*(.+)$'),
+    'table_row': re.compile(r'^\|(.+)\|$'),
+    'table_separator': re.compile(r'^[\|\+][-\+\|]+[\|\+]$'),
+    'figure_caption': re.compile(r'^(Figure|Fig\.?|Table|Tbl\.?)\s*(\d+(?:\.\d+)*)[\.:]\s*(.+)$', re.IGNORECASE),
+    'equation': re.compile(r'^\s*\$\$(.*?)\$\$\s*$', re.DOTALL),
+    'url': re.compile(r'https?://[^\s<>"{}|\\^`[\]]+'),
+    'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    'file_path': re.compile(r'[/\\]?[\w\-./\\]+\.\w{1,6}'),
+    'date': re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}\b'),
+})
+# Patterns used for every section are also bound directly
+_HEADING_HASH_RE = _PARSER_PATTERNS['heading_hash']
+_HEADING_CHAPTER_RE = _PARSER_PATTERNS['heading_chapter']
+_HEADING_NUMBERED_RE = _PARSER_PATTERNS['heading_numbered']
+_URL_RE = _PARSER_PATTERNS['url']
+# _is_heading only needs to know whether any heading form matches
+_ANY_HEADING_RE = re.compile('|'.join(
+    _scoped_pattern(pattern) for pattern in (_HEADING_HASH_RE, _HEADING_CHAPTER_RE, _HEADING_NUMBERED_RE)
+))
+# Bullet/numbered and row/separator alternatives merged so each line is matched once
+_LIST_LINE_RE = re.compile(
+    r'^[\s]*(?:[-\*\+\u2022\u25E6\u25D8\u25CB\u25CF]|(?:\d+|[a-z]|[A-Z]|[ivxlcdm]+|[IVXLCDM]+)[.)\]])\s+.+$'
+)
+_TABLE_LINE_RE = re.compile(r'^(?:\|.+\||[\|\+][-\+\|]+[\|\+])$')
+# Every table line starts with one of these; testing the first character is
+# cheaper than a regex call for the prose lines that make up most sections
+_TABLE_LINE_STARTS = '|+'
+
+_TOPIC_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_TOPIC_BLOCK_TYPES = frozenset({ContentType.PARAGRAPH.value, ContentType.HEADING.value})
+
+_SECTION_BREAK_RE = re.compile(r'\n\n+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+# Matches only whitespace that changes; single spaces between words are left alone
+_INLINE_WHITESPACE_RE = re.compile(r'[ \t]{2,}|\t')
+# Single-character rewrites applied by _normalize_text. Unicode spaces are mapped
+# after the whitespace collapse, so they are not merged with neighbouring spaces.
+_TEXT_CHAR_TABLE = str.maketrans({
+    **dict.fromkeys('\u201C\u201D\u201E\u201F\u2033\u2036', '"'),
+    **dict.fromkeys('\u2018\u2019\u201A\u201B\u2032\u2035', "'"),
+    **dict.fromkeys('\u2014\u2013\u2012', '-'),
+    '\u2026': '...',
+    **dict.fromkeys('\u00A0\u202F\u205F\u3000', ' '),
+    **{chr(code): ' ' for code in range(0x2000, 0x200C)},
+    **dict.fromkeys('\u25E6\u25D8\u25CB\u25CF', '\u2022'),
+})
+# Anything any _normalize_text rewrite would change; clean text skips every pass
+_NORMALIZE_TRIGGER_RE = re.compile(
+    r'\n\s+\n|[ \t]{2,}|\t|\w-\n\w|\w\.\n\w|[' + re.escape(''.join(map(chr, _TEXT_CHAR_TABLE))) + ']'
+)
+
+
+def _is_word_char(char: str) -> bool:
+    r"""Same test as the regex \w class for a single character"""
+    return char.isalnum() or char == '_'
+
+
+# The line-break fixes below only engage where str.find locates the two-character
+# marker, and resume scanning where the equivalent re.sub would, so overlapping
+# candidates are treated identically.
+def _join_hyphenated_breaks(text: str) -> str:
+    r"""Drop '-\n' between words, as re.sub(r'(\w+)-\n(\w+)', r'\1\2', text)"""
+    index = text.find('-\n')
+    if index < 0:
+        return text
+
+    parts = []
+    start = resume = 0
+    length = len(text)
+    while index >= 0:
+        if (index > resume and index + 2 < length and
+                _is_word_char(text[index - 1]) and _is_word_char(text[index + 2])):
+            parts.append(text[start:index])
+            start = index + 2
+            # The regex consumes the whole following word before matching again
+            resume = index + 3
+            while resume < length and _is_word_char(text[resume]):
+                resume += 1
+            index = text.find('-\n', resume)
+        else:
+            index = text.find('-\n', index + 1)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+
+def _fix_broken_sentences(text: str) -> str:
+    r"""Rejoin '.\n' between words as '. ', as re.sub(r'(\w)\.(\n)(\w)', r'\1. \3', text)"""
+    index = text.find('.\n')
+    if index < 0:
+        return text
+
+    parts = []
+    start = resume = 0
+    length = len(text)
+    while index >= 0:
+        if (index > resume and index + 2 < length and
+                _is_word_char(text[index - 1]) and _is_word_char(text[index + 2])):
+            parts.append(text[start:index])
+            parts.append('. ')
+            start = index + 2
+            resume = index + 3
+            index = text.find('.\n', resume)
+        else:
+            index = text.find('.\n', index + 1)
+    parts.append(text[start:])
+    return ''.join(parts)
+
+
+_BASIC_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'until', 'while',
+    'of', 'at', 'by', 'for', 'with', 'about', 'against', 'between', 'into', 'through',
+    'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down', 'in',
+    'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once', 'here',
+    'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more',
+    'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
+    'than', 'too', 'very', 'can', 'will', 'just', 'should', 'now'
+})
+
+
+@functools.cache
+def _nltk_stopwords() -> Optional[Any]:
+    """Import the NLTK stopwords corpus, fetching its data on first use"""
+    nltk = _lazy_import('nltk')
+    corpus = _lazy_import('nltk.corpus') if nltk else None
+    if corpus is None:
+        return None
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+    return corpus.stopwords
+
+
+@functools.lru_cache(maxsize=None)
+def _english_stopwords() -> frozenset:
+    """Load the English stopword set once and share it across parsers"""
+    stopwords = _nltk_stopwords()
+    if stopwords is not None:
+        try:
+            words = frozenset(stopwords.words('english'))
+            logger.debug("NLTK stopwords loaded successfully")
+            return words
+        except Exception as e:
+            logger.warning(f"Failed to load NLTK stopwords: {e}")
+    else:
+        logger.debug("Using basic stopwords set (NLTK not available)")
+    return _BASIC_STOPWORDS
+
+
+@functools.lru_cache(maxsize=32)
+def _stopwords_for(language: str) -> frozenset:
+    """Load the stopword set for a detected language once, falling back to English"""
+    stopwords = _nltk_stopwords()
+    if stopwords is not None:
+        try:
+            return frozenset(stopwords.words(language))
+        except Exception:
+            logger.debug(f"No NLTK stopwords available for {language}, using English")
+    return _english_stopwords()
+
+
+# Characters taken from each of the start, middle and end of a document for langdetect
+LANGDETECT_SLICE_CHARS = 1500
+
+
+# Documents arrive as consecutive text parts (pages, paragraphs, chapters) that
+# are treated as if joined by this separator
+PART_SEPARATOR = '\n\n'
+
+
+def _joined_slice(parts: List[str], start: int, stop: int) -> str:
+    """PART_SEPARATOR.join(parts)[start:stop] without building the joined string"""
+    pieces = []
+    offset = 0
+    chunks = itertools.chain.from_iterable((PART_SEPARATOR, part) for part in parts)
+    next(chunks, None)
+    for chunk in chunks:
+        end = offset + len(chunk)
+        if end > start:
+            pieces.append(chunk[max(start - offset, 0):stop - offset])
+        offset = end
+        if offset >= stop:
+            break
+    return ''.join(pieces)
+
+
+def _language_sample(parts: List[str]) -> str:
+    """Word-aligned slices from the start, middle and end of a document"""
+    size = LANGDETECT_SLICE_CHARS
+    length = sum(map(len, parts)) + len(PART_SEPARATOR) * (len(parts) - 1)
+    if length <= 3 * size:
+        return PART_SEPARATOR.join(parts)
+
+    middle = length // 2
+    head = _joined_slice(parts, 0, size).rsplit(' ', 1)[0]
+    body = _joined_slice(parts, middle, middle + size).split(' ', 1)[-1].rsplit(' ', 1)[0]
+    tail = _joined_slice(parts, length - size, length).split(' ', 1)[-1]
+    return ' '.join((head, body, tail))
+
+
+def _process_section_chunk(sections: List[str], source_type: Optional[str]) -> List[List['ContentBlock']]:
+    """Classify a slice of sections independently (process pool worker)"""
+    parser = DocumentParser()
+    return [parser._process_section(section, source_type) for section in sections]
+
+
 class DocumentParser:
     """Advanced parser for AI-readable structured content with enhanced normalization"""
 
-    def __init__(self, language: str = 'auto'):
-        self.patterns = self._compile_patterns()
+    def __init__(self, language: str = 'auto', workers: int = 1):
+        self.patterns = _PARSER_PATTERNS
         self.code_indicators = {
             'prefixes': ['$', '#', '>>>', '>', 'C:\\', '~/', 'PS>', '\u03BB '],
             'extensions': ['.py', '.js', '.html', '.css', '.sql', '.sh', '.bat', '.c', '.cpp', '.java', '.rb', '.php'],
@@ -624,95 +952,83 @@ class DocumentParser:
             ]
         }
 
+        # One search per line: an indicator prefix of the stripped line, or a keyword anywhere.
+        # A prefix ending in whitespace must still be followed by text to survive the strip.
+        prefixes = '|'.join(
+            re.escape(prefix) + (r'(?=\s*\S)' if prefix[-1].isspace() else '')
+            for prefix in self.code_indicators['prefixes']
+        )
+        self._code_indicator_re = re.compile('|'.join((
+            rf'^\s*(?:{prefixes})', *map(re.escape, self.code_indicators['keywords'])
+        )))
+
         self.language = language
-        self.normalizer = ContentNormalizer()
+        self.workers = max(1, workers)
+        self.normalizer = ContentNormalizer(workers=workers)
         self._initialize_nlp_resources()
 
     def _initialize_nlp_resources(self):
         """Initialize NLP resources for text analysis"""
-        self.stop_words = set()
+        # Language of the document being parsed; None means the English default
+        self._current_lang: Optional[str] = None
+        _english_stopwords()
 
-        if available_modules.get('nltk', False):
-            try:
-                self.stop_words = set(stopwords.words('english'))
-                logger.debug("NLTK stopwords loaded successfully")
-            except Exception as e:
-                logger.warning(f"Failed to load NLTK stopwords: {e}")
-        else:
-            logger.debug("Using basic stopwords set (NLTK not available)")
-            self.stop_words = {
-                'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'until', 'while',
-                'of', 'at', 'by', 'for', 'with', 'about', 'against', 'between', 'into', 'through',
-                'during', 'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down', 'in',
-                'out', 'on', 'off', 'over', 'under', 'again', 'further', 'then', 'once', 'here',
-                'there', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more',
-                'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
-                'than', 'too', 'very', 'can', 'will', 'just', 'should', 'now'
-            }
-
-    def _compile_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for content detection"""
-        return {
-            'heading_hash': re.compile(r'^(#{1,6})\s+(.+)$'),
-            'heading_underline': re.compile(r'^(.+)\n([=\-])\2{2,}$', re.MULTILINE),
-            'heading_numbered': re.compile(r'^(\d+(?:\.\d+)*)\s+(.+)$'),
-            'heading_chapter': re.compile(r'^(Chapter|Section|Part|CHAPTER|SECTION|PART|Ch\.?|Sec\.?)\s*(\d+|[IVXLCDM]+)[\s:\-]*(.*)$', re.IGNORECASE),
-            'code_fence': re.compile(r'^```(\w+)?\n(.*?)^```$', re.MULTILINE | re.DOTALL),
-            'code_indent': re.compile(r'^(    .+)$', re.MULTILINE),
-            'code_line': re.compile(r'^[\$#>]\s*(.+)$'),
-            'bullet_list': re.compile(r'^[\s]*[-\*\+\u2022\u25E6\u25D8\u25CB\u25CF]\s+(.+)$'),
-            'numbered_list': re.compile(r'^[\s]*(\d+|[a-z]|[A-Z]|[ivxlcdm]+|[IVXLCDM]+)[.)\]]\s+(.+)$'),
-            'blockquote': re.compile(r'^>\s*(.+)$'),
-            'table_row': re.compile(r'^\|(.+)\|$'),
-            'table_separator': re.compile(r'^[\|\+][-\+\|]+[\|\+]$'),
-            'figure_caption': re.compile(r'^(Figure|Fig\.?|Table|Tbl\.?)\s*(\d+(?:\.\d+)*)[\.:]\s*(.+)$', re.IGNORECASE),
-            'equation': re.compile(r'^\s*\$\$(.*?)\$\$\s*$', re.DOTALL),
-            'url': re.compile(r'https?://[^\s<>"{}|\\^`[\]]+'),
-            'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            'file_path': re.compile(r'[/\\]?[\w\-./\\]+\.\w{1,6}'),
-            'date': re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{4}[/-]\d{1,2}[/-]\d{1,2}\b|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}\b'),
-        }
+    @property
+    def stop_words(self) -> frozenset:
+        """Shared stopword set for the current document's language"""
+        if self._current_lang is None:
+            return _english_stopwords()
+        return _stopwords_for(self._current_lang)
 
     def parse(self, text: str, source_type: str = None) -> Dict[str, Any]:
         """Parse text into AI-optimized JSON structure with enhanced normalization"""
-        word_count = len(text.split())
+        return self.parse_parts([text], source_type=source_type)
+
+    def parse_parts(self, parts: Iterable[str], source_type: str = None) -> Dict[str, Any]:
+        """Parse a document given as text parts, without joining them into one string"""
+        parts = list(parts)
+        word_count = sum(len(part.split()) for part in parts)
         logger.info(f"Parsing {word_count} words of content")
 
         detected_lang = 'en'
-        if self.language == 'auto' and available_modules.get('langdetect', False):
+        self._current_lang = None
+        langdetect = _lazy_import('langdetect') if self.language == 'auto' else None
+        if langdetect is not None:
             try:
-                sample_size = min(5000, len(text))
-                sample = text[:sample_size]
-                detected_lang = detect_language(sample)
+                detected_lang = langdetect.detect(_language_sample(parts))
                 logger.info(f"Detected document language: {detected_lang}")
 
-                if available_modules.get('nltk', False):
-                    try:
-                        self.stop_words = set(stopwords.words(detected_lang))
-                    except Exception:
-                        logger.debug(f"No NLTK stopwords available for {detected_lang}, using English")
+                self._current_lang = detected_lang
             except Exception as e:
                 logger.warning(f"Language detection failed: {e}")
 
         progress = ProgressTracker(5, "Text processing")
 
+        # Parts are separated by a blank line, which no normalization pass joins
+        # across, so each part is normalized and split on its own
         with memory_management():
-            text = self._normalize_text(text)
+            parts = [self._normalize_text(part) for part in parts]
             progress.update()
 
         with memory_management():
-            sections = self._split_into_sections(text)
+            sections = [section for part in parts for section in self._split_into_sections(part)]
+            del parts
             progress.update()
 
         content_blocks = []
         total_sections = len(sections)
         section_progress = ProgressTracker(total_sections, "Processing sections")
 
-        for section in sections:
-            with memory_management():
-                blocks = self._process_section(section, source_type)
+        # A full collection per section is O(live objects) each time, so the loop
+        # runs under one context; progress and young-generation sweeps are batched
+        with memory_management():
+            for index, blocks in enumerate(self._process_sections(sections, source_type), 1):
                 content_blocks.extend(blocks)
-                section_progress.update()
+                if index % SECTION_BATCH_SIZE == 0:
+                    section_progress.update(SECTION_BATCH_SIZE)
+                    gc.collect(0)
+            if total_sections % SECTION_BATCH_SIZE:
+                section_progress.update(total_sections % SECTION_BATCH_SIZE)
 
         progress.update()
 
@@ -721,17 +1037,16 @@ class DocumentParser:
             progress.update()
 
         with memory_management():
-            metadata = self._extract_document_metadata(content_blocks)
+            word_freq = Counter()
+            metadata = self._extract_document_metadata(content_blocks, word_freq)
             metadata['language'] = detected_lang
-            all_text = " ".join([block.content for block in content_blocks
-                              if block.type in [ContentType.PARAGRAPH.value, ContentType.HEADING.value]])
-            key_topics = self._extract_key_topics(all_text)
+            key_topics = self._top_topics(word_freq)
             progress.update()
 
         result = {
             'document_type': 'structured_text',
             'metadata': metadata,
-            'content_blocks': [block.to_dict() for block in content_blocks],
+            'content_blocks': list(map(ContentBlock.to_dict, content_blocks)),
             'summary': self._generate_summary(content_blocks, key_topics),
             'version': __version__,
             'normalization_applied': True
@@ -742,32 +1057,44 @@ class DocumentParser:
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for consistent processing"""
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
-        # Normalize smart quotes to regular quotes
-        text = re.sub(r'[\u201C\u201D\u201E\u201F\u2033\u2036]', '"', text)
-        text = re.sub(r'[\u2018\u2019\u201A\u201B\u2032\u2035]', "'", text)
-        # Normalize dashes and ellipsis
-        text = re.sub(r'[\u2014\u2013\u2012]', '-', text)
-        text = re.sub(r'\u2026', '...', text)
-        text = re.sub(r'(\w+)-\n(\w+)', r'\1\2', text)
-        text = re.sub(r'(\w)\.(\n)(\w)', r'\1. \3', text)
-        text = re.sub(r'[\u00A0\u2000-\u200B\u202F\u205F\u3000]', ' ', text)
-        text = re.sub(r'[\u2022\u25E6\u25D8\u25CB\u25CF]', '\u2022', text)
+        if not _NORMALIZE_TRIGGER_RE.search(text):
+            return text.strip()
+
+        text = _BLANK_LINES_RE.sub('\n\n', text)
+        text = _INLINE_WHITESPACE_RE.sub(' ', text)
+        # Smart quotes, dashes, ellipsis, Unicode spaces and bullet glyphs in one pass.
+        # The table only holds non-ASCII characters, and isascii() is a flag check.
+        if not text.isascii():
+            text = text.translate(_TEXT_CHAR_TABLE)
+        text = _join_hyphenated_breaks(text)
+        text = _fix_broken_sentences(text)
 
         return text.strip()
 
     def _split_into_sections(self, text: str) -> List[str]:
         """Split text into logical sections"""
-        section_pattern = re.compile(r'\n\n+')
-        sections = section_pattern.split(text)
-        return [s.strip() for s in sections if s.strip()]
+        return [section for section in map(str.strip, _SECTION_BREAK_RE.split(text)) if section]
+
+    def _process_sections(self, sections: List[str], source_type: str = None) -> Iterator[List[ContentBlock]]:
+        """Yield the blocks of each section in order, fanning out to worker processes for large inputs"""
+        if self.workers == 1 or len(sections) < PARALLEL_SECTION_MIN_SECTIONS:
+            yield from (self._process_section(section, source_type) for section in sections)
+            return
+
+        chunk_size = -(-len(sections) // self.workers)
+        chunks = [sections[i:i + chunk_size] for i in range(0, len(sections), chunk_size)]
+        logger.debug(f"Processing {len(sections)} sections across {len(chunks)} worker processes")
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for chunk in executor.map(_process_section_chunk, chunks, [source_type] * len(chunks)):
+                yield from chunk
 
     def _process_section(self, section: str, source_type: str = None) -> List[ContentBlock]:
         """Process a section and return content blocks"""
         blocks = []
+        kind = self._classify_section(section)
 
-        if self._is_heading(section):
+        if kind is ContentType.HEADING:
             level, content = self._extract_heading(section)
             blocks.append(ContentBlock(
                 type=ContentType.HEADING.value,
@@ -775,33 +1102,33 @@ class DocumentParser:
                 level=level,
                 metadata={'source_type': source_type} if source_type else {}
             ))
-        elif self._is_code_block(section):
+        elif kind is ContentType.CODE_BLOCK:
             language = self._detect_code_language(section)
             blocks.append(ContentBlock(
                 type=ContentType.CODE_BLOCK.value,
                 content=section,
                 metadata={'language': language, 'source_type': source_type} if source_type else {'language': language}
             ))
-        elif self._is_list(section):
+        elif kind is ContentType.LIST:
             blocks.append(ContentBlock(
                 type=ContentType.LIST.value,
                 content=section,
                 metadata={'source_type': source_type} if source_type else {}
             ))
-        elif self._is_quote(section):
+        elif kind is ContentType.QUOTE:
             blocks.append(ContentBlock(
                 type=ContentType.QUOTE.value,
                 content=section.lstrip('> '),
                 metadata={'source_type': source_type} if source_type else {}
             ))
-        elif self._is_table(section):
+        elif kind is ContentType.TABLE:
             blocks.append(ContentBlock(
                 type=ContentType.TABLE.value,
                 content=section,
                 metadata={'source_type': source_type} if source_type else {}
             ))
         else:
-            urls = self.patterns['url'].findall(section)
+            urls = _URL_RE.findall(section)
             metadata = {'source_type': source_type} if source_type else {}
             if urls:
                 metadata['urls'] = urls
@@ -814,15 +1141,45 @@ class DocumentParser:
 
         return blocks
 
+    def _classify_section(self, section: str) -> ContentType:
+        """Pick the block type of a section, in the priority order of the _is_* checks"""
+        text = section.strip()
+        if self._is_heading(text):
+            return ContentType.HEADING
+        if text.startswith('```') and text.endswith('```'):
+            return ContentType.CODE_BLOCK
+
+        # Same per-line tests as _is_code_block, _is_list, _is_quote and _is_table,
+        # tallied over a single split of the section
+        lines = text.split('\n')
+        code_lines = list_lines = quote_lines = table_lines = 0
+        for line in lines:
+            if line.startswith(('    ', '\t')) or self._code_indicator_re.search(line):
+                code_lines += 1
+            if _LIST_LINE_RE.match(line):
+                list_lines += 1
+            if line.startswith('>'):
+                quote_lines += 1
+            if line[:1] in _TABLE_LINE_STARTS and _TABLE_LINE_RE.match(line):
+                table_lines += 1
+
+        threshold = len(lines) * 0.5
+        multiline = len(lines) >= 2
+        if code_lines >= threshold:
+            return ContentType.CODE_BLOCK
+        if multiline and list_lines >= threshold:
+            return ContentType.LIST
+        if quote_lines >= threshold:
+            return ContentType.QUOTE
+        if multiline and table_lines >= threshold:
+            return ContentType.TABLE
+        return ContentType.PARAGRAPH
+
     def _is_heading(self, text: str) -> bool:
         """Check if text is a heading"""
         text = text.strip()
 
-        if self.patterns['heading_hash'].match(text):
-            return True
-        if self.patterns['heading_chapter'].match(text):
-            return True
-        if self.patterns['heading_numbered'].match(text):
+        if _ANY_HEADING_RE.match(text):
             return True
         if len(text) < 100 and text.isupper():
             return True
@@ -835,17 +1192,17 @@ class DocumentParser:
         """Extract heading level and content"""
         text = text.strip()
 
-        hash_match = self.patterns['heading_hash'].match(text)
+        hash_match = _HEADING_HASH_RE.match(text)
         if hash_match:
             level = len(hash_match.group(1))
             content = hash_match.group(2)
             return level, content
 
-        chapter_match = self.patterns['heading_chapter'].match(text)
+        chapter_match = _HEADING_CHAPTER_RE.match(text)
         if chapter_match:
             return 1, text
 
-        numbered_match = self.patterns['heading_numbered'].match(text)
+        numbered_match = _HEADING_NUMBERED_RE.match(text)
         if numbered_match:
             number = numbered_match.group(1)
             level = number.count('.') + 1
@@ -864,11 +1221,7 @@ class DocumentParser:
         code_indicators = 0
 
         for line in lines:
-            if line.startswith('    ') or line.startswith('\t'):
-                code_indicators += 1
-            elif any(line.strip().startswith(prefix) for prefix in self.code_indicators['prefixes']):
-                code_indicators += 1
-            elif any(keyword in line for keyword in self.code_indicators['keywords']):
+            if line.startswith(('    ', '\t')) or self._code_indicator_re.search(line):
                 code_indicators += 1
 
         return code_indicators >= len(lines) * 0.5
@@ -891,10 +1244,7 @@ class DocumentParser:
         if len(lines) < 2:
             return False
 
-        list_lines = 0
-        for line in lines:
-            if self.patterns['bullet_list'].match(line) or self.patterns['numbered_list'].match(line):
-                list_lines += 1
+        list_lines = sum(1 for line in lines if _LIST_LINE_RE.match(line))
 
         return list_lines >= len(lines) * 0.5
 
@@ -910,15 +1260,13 @@ class DocumentParser:
         if len(lines) < 2:
             return False
 
-        table_lines = 0
-        for line in lines:
-            if self.patterns['table_row'].match(line) or self.patterns['table_separator'].match(line):
-                table_lines += 1
+        table_lines = sum(1 for line in lines if line[:1] in _TABLE_LINE_STARTS and _TABLE_LINE_RE.match(line))
 
         return table_lines >= len(lines) * 0.5
 
-    def _extract_document_metadata(self, blocks: List[ContentBlock]) -> Dict[str, Any]:
-        """Extract document metadata from content blocks"""
+    def _extract_document_metadata(self, blocks: List[ContentBlock],
+                                   word_freq: Optional[Counter] = None) -> Dict[str, Any]:
+        """Extract document metadata, counting topic words into word_freq in the same pass"""
         metadata = {
             'title': None,
             'word_count': 0,
@@ -927,15 +1275,17 @@ class DocumentParser:
             'content_types': {}
         }
 
+        content_types = metadata['content_types']
         for block in blocks:
             metadata['word_count'] += len(block.content.split())
 
             block_type = block.type
-            if block_type not in metadata['content_types']:
-                metadata['content_types'][block_type] = 0
-            metadata['content_types'][block_type] += 1
+            content_types[block_type] = content_types.get(block_type, 0) + 1
 
-            if block.type == ContentType.HEADING.value and block.level == 1 and not metadata['title']:
+            if word_freq is not None and block_type in _TOPIC_BLOCK_TYPES:
+                self._count_topic_words(word_freq, block.content)
+
+            if block_type == ContentType.HEADING.value and block.level == 1 and not metadata['title']:
                 metadata['title'] = block.content
 
         return metadata
@@ -945,12 +1295,17 @@ class DocumentParser:
         if not text:
             return []
 
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-
-        filtered_words = [w for w in words if w not in self.stop_words]
+        word_freq = Counter()
+        self._count_topic_words(word_freq, text)
+        return self._top_topics(word_freq)
 
-        word_freq = Counter(filtered_words)
+    def _count_topic_words(self, word_freq: Counter, text: str) -> None:
+        """Add the non-stopword words of text to word_freq"""
+        stop_words = self.stop_words
+        word_freq.update(word for word in _TOPIC_WORD_RE.findall(text.lower()) if word not in stop_words)
 
+    def _top_topics(self, word_freq: Counter) -> List[str]:
+        """Most frequent words that occur more than once"""
         top_words = word_freq.most_common(20)
 
         return [word for word, count in top_words if count > 1]
@@ -981,6 +1336,107 @@ class DocumentParser:
         return " | ".join(summary_parts) if summary_parts else "Document processed successfully"
 
 
+# tesserocr API objects are not thread-safe, so each thread keeps its own per language
+_OCR_THREAD_STATE = threading.local()
+
+
+def _ocr_available() -> bool:
+    """Whether tesserocr or pytesseract can be used for OCR"""
+    return _lazy_import('tesserocr') is not None or _lazy_import('pytesseract') is not None
+
+
+def _ocr_image(img, lang: Optional[str] = None) -> str:
+    """OCR a PIL image in-process with tesserocr when installed, else through pytesseract"""
+    tesserocr = _lazy_import('tesserocr')
+    if tesserocr is None:
+        return _lazy_import('pytesseract').image_to_string(img, lang=lang)
+
+    # Loading the language model dominates a call, so the API instance is reused
+    lang = lang or 'eng'
+    apis = _OCR_THREAD_STATE.__dict__.setdefault('apis', {})
+    api = apis.get(lang)
+    if api is None:
+        api = apis[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+    api.SetImage(img)
+    return api.GetUTF8Text()
+
+
+# Below this many pages, worker start-up outweighs parallel page extraction
+PARALLEL_PDF_MIN_PAGES = 16
+
+
+def _pdf_page_text(page) -> str:
+    """Text of a PDF page, falling back to OCR for pages without a text layer"""
+    page_text = page.get_text()
+
+    if not page_text.strip():
+        Image = _lazy_import('PIL.Image') if _ocr_available() else None
+        if Image is not None:
+            pix = page.get_pixmap()
+            img = Image.open(io.BytesIO(pix.tobytes("png")))
+            page_text = _ocr_image(img)
+
+    return page_text
+
+
+def _extract_pdf_pages(path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) of a PDF (process pool worker)"""
+    fitz = _lazy_import('fitz')
+    with fitz.open(path) as doc:
+        return [_pdf_page_text(doc[page_num]) for page_num in range(start, min(stop, len(doc)))]
+
+
+def _translate_newlines(text: str) -> str:
+    """Apply the universal-newline translation text-mode open() performs"""
+    if '\r' not in text:
+        return text
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+@functools.lru_cache(maxsize=4096)
+def _magic_file_type(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Sniff a file type from magic bytes; keyed on mtime and size so edited files are re-read"""
+    mime = _lazy_import('magic').from_file(path, mime=True)
+    if 'pdf' in mime:
+        return 'pdf'
+    elif 'word' in mime or 'document' in mime:
+        return 'docx'
+    elif 'epub' in mime:
+        return 'epub'
+    elif 'image' in mime:
+        return 'image'
+    elif 'text' in mime:
+        return 'text'
+    return None
+
+
+# File types convert_batch hands to worker processes instead of threads
+PROCESS_POOL_FILE_TYPES = frozenset({'pdf', 'docx', 'epub', 'image'})
+# Fewer heavy files than this run on threads; a lone file gains nothing from a worker process
+PROCESS_POOL_MIN_FILES = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_converter(output_dir: str, language: str) -> 'DocumentConverter':
+    """Converter shared by every file a worker process handles"""
+    return DocumentConverter(output_dir=output_dir, language=language)
+
+
+def _convert_file_worker(output_dir: str, language: str, path: Union[str, Path]) -> Optional[Path]:
+    """Convert one file in a batch (process pool worker)"""
+    return _worker_converter(output_dir, language).convert_file(path)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available"""
+    if available_modules['orjson']:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 class DocumentConverter:
     """Main document converter class that handles multiple file formats"""
 
@@ -991,34 +1447,26 @@ class DocumentConverter:
         'epub': ['.epub'],
         'image': ['.png', '.jpg', '.jpeg', '.tiff', '.tif', '.bmp', '.gif']
     }
+    _TYPE_BY_SUFFIX = {ext: file_type for file_type, extensions in SUPPORTED_FORMATS.items() for ext in extensions}
 
-    def __init__(self, output_dir: str = None, language: str = 'auto'):
+    def __init__(self, output_dir: str = None, language: str = 'auto', workers: int = 1):
         self.output_dir = Path(output_dir) if output_dir else Path.cwd() / 'output'
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.parser = DocumentParser(language=language)
+        self.parser = DocumentParser(language=language, workers=workers)
         self.language = language
+        # Worker processes for the pages, sections and blocks of a single large document
+        self.workers = max(1, workers)
 
     def get_file_type(self, file_path: Path) -> Optional[str]:
         """Determine file type from extension or magic bytes"""
-        ext = file_path.suffix.lower()
-
-        for file_type, extensions in self.SUPPORTED_FORMATS.items():
-            if ext in extensions:
-                return file_type
+        file_type = self._TYPE_BY_SUFFIX.get(file_path.suffix.lower())
+        if file_type:
+            return file_type
 
-        if available_modules.get('magic', False):
+        if _lazy_import('magic') is not None:
             try:
-                mime = magic.from_file(str(file_path), mime=True)
-                if 'pdf' in mime:
-                    return 'pdf'
-                elif 'word' in mime or 'document' in mime:
-                    return 'docx'
-                elif 'epub' in mime:
-                    return 'epub'
-                elif 'image' in mime:
-                    return 'image'
-                elif 'text' in mime:
-                    return 'text'
+                stat = file_path.stat()
+                return _magic_file_type(str(file_path), stat.st_mtime_ns, stat.st_size)
             except Exception as e:
                 logger.warning(f"Magic detection failed: {e}")
 
@@ -1040,13 +1488,13 @@ class DocumentConverter:
         logger.info(f"Converting {file_path.name} ({file_type})")
 
         try:
-            text = self._extract_text(file_path, file_type)
+            parts = self._extract_text(file_path, file_type)
 
-            if not text or not text.strip():
+            if not any(part.strip() for part in parts):
                 logger.warning(f"No text extracted from {file_path.name}")
                 return None
 
-            result = self.parser.parse(text, source_type=file_type)
+            result = self.parser.parse_parts(parts, source_type=file_type)
 
             result['metadata']['source_file'] = file_path.name
             result['metadata']['source_format'] = file_type
@@ -1054,8 +1502,7 @@ class DocumentConverter:
 
             output_path = self.output_dir / f"{file_path.stem}.json"
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            _write_json(output_path, result)
 
             logger.info(f"Converted: {file_path.name} -> {output_path.name}")
             print(f"Converted: {file_path.name} -> {output_path}", flush=True)
@@ -1066,14 +1513,14 @@ class DocumentConverter:
             logger.error(f"Error converting {file_path.name}: {e}")
             return None
 
-    def _extract_text(self, file_path: Path, file_type: str) -> str:
-        """Extract text from file based on type"""
+    def _extract_text(self, file_path: Path, file_type: str) -> List[str]:
+        """Extract text from file based on type, as parts separated by blank lines"""
         extractors = {
             'pdf': self._extract_pdf,
             'docx': self._extract_docx,
-            'text': self._extract_text_file,
+            'text': lambda path: [self._extract_text_file(path)],
             'epub': self._extract_epub,
-            'image': self._extract_image_ocr
+            'image': lambda path: [self._extract_image_ocr(path)]
         }
 
         extractor = extractors.get(file_type)
@@ -1082,9 +1529,10 @@ class DocumentConverter:
 
         return extractor(file_path)
 
-    def _extract_pdf(self, file_path: Path) -> str:
-        """Extract text from PDF file"""
-        if not available_modules.get('fitz', False):
+    def _extract_pdf(self, file_path: Path) -> List[str]:
+        """Extract the text of each PDF page"""
+        fitz = _lazy_import('fitz')
+        if fitz is None:
             raise ImportError("PyMuPDF not available for PDF processing")
 
         text_parts = []
@@ -1093,26 +1541,33 @@ class DocumentConverter:
             total_pages = len(doc)
             progress = ProgressTracker(total_pages, "Extracting PDF pages")
 
-            for page_num, page in enumerate(doc):
-                page_text = page.get_text()
-
-                if not page_text.strip() and available_modules.get('pytesseract', False):
-                    pix = page.get_pixmap()
-                    img_data = pix.tobytes("png")
-                    img = Image.open(io.BytesIO(img_data))
-                    page_text = pytesseract.image_to_string(img)
-
-                text_parts.append(page_text)
-                progress.update()
-
-        return '\n\n'.join(text_parts)
-
-    def _extract_docx(self, file_path: Path) -> str:
-        """Extract text from DOCX file"""
-        if not available_modules.get('docx', False):
+            if self.workers == 1 or total_pages < PARALLEL_PDF_MIN_PAGES:
+                for page in doc:
+                    text_parts.append(_pdf_page_text(page))
+                    progress.update()
+                return text_parts
+
+        # PyMuPDF documents cannot be shared across threads, so each worker
+        # process opens the file itself and extracts a contiguous page range
+        chunk_size = -(-total_pages // self.workers)
+        starts = range(0, total_pages, chunk_size)
+        logger.debug(f"Extracting {total_pages} PDF pages across {len(starts)} worker processes")
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for pages in executor.map(_extract_pdf_pages, [str(file_path)] * len(starts), starts,
+                                      [start + chunk_size for start in starts]):
+                text_parts.extend(pages)
+                progress.update(len(pages))
+
+        return text_parts
+
+    def _extract_docx(self, file_path: Path) -> List[str]:
+        """Extract the paragraphs and tables of a DOCX file"""
+        docx = _lazy_import('docx')
+        if docx is None:
             raise ImportError("python-docx not available for DOCX processing")
 
-        doc = DocxDocument(str(file_path))
+        doc = docx.Document(str(file_path))
         text_parts = []
 
         for para in doc.paragraphs:
@@ -1136,25 +1591,40 @@ class DocumentConverter:
                 table_text.append(f"| {row_text} |")
             text_parts.append('\n'.join(table_text))
 
-        return '\n\n'.join(text_parts)
+        return text_parts
 
     def _extract_text_file(self, file_path: Path) -> str:
         """Extract text from plain text file"""
-        encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
+        # Read once and decode in memory instead of reopening the file per encoding
+        raw = file_path.read_bytes()
 
-        for encoding in encodings:
+        for encoding in self._candidate_encodings(raw):
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    return f.read()
-            except UnicodeDecodeError:
+                text = raw.decode(encoding)
+            except (UnicodeDecodeError, LookupError):
                 continue
+            return _translate_newlines(text)
+
+        return _translate_newlines(raw.decode('utf-8', errors='replace'))
+
+    def _candidate_encodings(self, raw: bytes) -> Iterator[str]:
+        """Encodings to try in order: UTF-8, then a detected charset, then the fixed fallbacks"""
+        yield 'utf-8'
+
+        charset_normalizer = _lazy_import('charset_normalizer')
+        if charset_normalizer is not None:
+            best = charset_normalizer.from_bytes(raw).best()
+            if best is not None:
+                yield best.encoding
 
-        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-            return f.read()
+        yield from ('utf-16', 'latin-1', 'cp1252')
 
-    def _extract_epub(self, file_path: Path) -> str:
-        """Extract text from EPUB file"""
-        if not available_modules.get('ebooklib', False):
+    def _extract_epub(self, file_path: Path) -> List[str]:
+        """Extract the text of each EPUB document item"""
+        ebooklib = _lazy_import('ebooklib')
+        epub = _lazy_import('ebooklib.epub') if ebooklib else None
+        html2text = _lazy_import('html2text') if epub else None
+        if html2text is None:
             raise ImportError("ebooklib not available for EPUB processing")
 
         book = epub.read_epub(str(file_path))
@@ -1171,14 +1641,17 @@ class DocumentConverter:
                 text = h.handle(content)
                 text_parts.append(text)
 
-        return '\n\n'.join(text_parts)
+        return text_parts
 
     def _extract_image_ocr(self, file_path: Path) -> str:
         """Extract text from image using OCR"""
-        if not available_modules.get('PIL', False):
+        Image = _lazy_import('PIL.Image')
+        ImageOps = _lazy_import('PIL.ImageOps') if Image else None
+        ImageEnhance = _lazy_import('PIL.ImageEnhance') if ImageOps else None
+        if ImageEnhance is None:
             raise ImportError("Pillow not available for image processing")
-        if not available_modules.get('pytesseract', False):
-            raise ImportError("pytesseract not available for OCR")
+        if not _ocr_available():
+            raise ImportError("Neither tesserocr nor pytesseract available for OCR")
 
         img = Image.open(file_path)
 
@@ -1190,7 +1663,7 @@ class DocumentConverter:
         enhancer = ImageEnhance.Sharpness(img)
         img = enhancer.enhance(2.0)
 
-        text = pytesseract.image_to_string(img, lang='eng')
+        text = _ocr_image(img, lang='eng')
 
         return text
 
@@ -1204,8 +1677,24 @@ class DocumentConverter:
 
         progress = ProgressTracker(len(file_paths), "Converting files")
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_path = {executor.submit(self.convert_file, path): path for path in file_paths}
+        # Extraction and parsing hold the GIL, so heavy formats get their own
+        # interpreters; light text files stay on threads to skip process start-up
+        process_suffixes = {ext for file_type in PROCESS_POOL_FILE_TYPES
+                            for ext in self.SUPPORTED_FORMATS[file_type]}
+        heavy_files = sum(1 for path in file_paths if Path(path).suffix.lower() in process_suffixes)
+        if heavy_files < PROCESS_POOL_MIN_FILES or max_workers < 2:
+            process_suffixes = set()
+        output_dir = str(self.output_dir)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                ProcessPoolExecutor(max_workers=max_workers) as process_executor:
+            future_to_path = {}
+            for path in file_paths:
+                if Path(path).suffix.lower() in process_suffixes:
+                    future = process_executor.submit(_convert_file_worker, output_dir, self.language, path)
+                else:
+                    future = executor.submit(self.convert_file, path)
+                future_to_path[future] = path
 
             for future in as_completed(future_to_path):
                 path = future_to_path[future]
@@ -1274,7 +1763,7 @@ Examples:
         '-w', '--workers',
         type=int,
         default=4,
-        help='Number of parallel workers for batch processing (default: 4)'
+        help='Number of parallel workers for batch processing or a single large document (default: 4)'
     )
 
     parser.add_argument(
@@ -1303,11 +1792,6 @@ def main():
 
     output_dir = args.output_dir or os.path.join(os.path.expanduser('~'), 'DocuMancer_Output')
 
-    converter = DocumentConverter(
-        output_dir=output_dir,
-        language=args.language
-    )
-
     file_paths = []
     for pattern in args.files:
         path = Path(pattern)
@@ -1328,6 +1812,13 @@ def main():
 
     logger.info(f"Found {len(file_paths)} file(s) to convert")
 
+    # Batches spread files across workers; a single file spreads its pages, sections and blocks instead
+    converter = DocumentConverter(
+        output_dir=output_dir,
+        language=args.language,
+        workers=args.workers if len(file_paths) == 1 else 1
+    )
+
     if len(file_paths) == 1:
         result = converter.convert_file(file_paths[0])
         if result:
@@ -8,11 +8,16 @@ import logging
 import os
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from stat import S_ISREG
 from typing import List
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -20,7 +25,28 @@ class Settings(BaseModel):
   host: str = Field("127.0.0.1", description="Bind host", validation_alias="DOCUMANCER_HOST")
   port: int = Field(8000, description="Bind port", validation_alias="DOCUMANCER_PORT")
   log_level: str = Field("INFO", description="Log level", validation_alias="DOCUMANCER_LOG_LEVEL")
-  log_dir: Path = Field(default_factory=lambda: Path(os.environ.get("DOCUMANCER_LOG_DIR", "./logs")))
+  log_dir: Path = Field(
+    default_factory=lambda: Path(os.environ.get("DOCUMANCER_LOG_DIR", "./logs")),
+    validate_default=True,
+  )
+  # Threads per server process for /convert file reads
+  thread_pool_size: int = Field(
+    default_factory=lambda: os.environ.get("DOCUMANCER_THREAD_POOL_SIZE", "64"),
+    validate_default=True,
+    ge=1,
+  )
+  # Previews kept per server process; entries are keyed on mtime and size so edits invalidate them
+  cache_size: int = Field(
+    default_factory=lambda: os.environ.get("DOCUMANCER_CACHE_SIZE", "4096"),
+    validate_default=True,
+    ge=0,
+  )
+  # Files smaller than this many bytes are read on the event loop instead of a thread
+  sync_read_threshold: int = Field(
+    default_factory=lambda: os.environ.get("DOCUMANCER_SYNC_READ_THRESHOLD", str(64 * 1024)),
+    validate_default=True,
+    ge=0,
+  )
 
   @field_validator("log_dir")
   @classmethod
@@ -65,9 +91,28 @@ def configure_logging() -> logging.Logger:
 
 
 logger = configure_logging()
-app = FastAPI(title="DocuMancer Backend", version="0.2.0")
 
-SUPPORTED_SUFFIXES = {".txt", ".md", ".json"}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  # asyncio.to_thread runs on the loop's default executor, whose stdlib size
+  # (min(32, cpu_count + 4)) is too narrow for many concurrent multi-file requests.
+  # Each uvicorn worker process gets its own pool of this size.
+  executor = ThreadPoolExecutor(max_workers=settings.thread_pool_size, thread_name_prefix="documancer-io")
+  asyncio.get_running_loop().set_default_executor(executor)
+  app.state.executor = executor
+  try:
+    yield
+  finally:
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+app = FastAPI(title="DocuMancer Backend", version="0.2.0", lifespan=lifespan)
+
+SUPPORTED_SUFFIXES = frozenset({".txt", ".md", ".json"})
+PREVIEW_CHARS = 400
+# Characters decoded per read while measuring a file, bounding memory for large inputs
+READ_CHUNK_CHARS = 1 << 20
 
 
 class ConvertRequest(BaseModel):
@@ -101,6 +146,11 @@ class ConversionResult(BaseModel):
   content: dict | None = None
 
 
+class ConvertResponse(BaseModel):
+  request_id: str
+  results: List[ConversionResult]
+
+
 @app.middleware("http")
 async def request_context(request: Request, call_next):  # noqa: D401
   request_id = request.headers.get("x-request-id", str(uuid.uuid4()))
@@ -108,6 +158,13 @@ async def request_context(request: Request, call_next):  # noqa: D401
   start = time.perf_counter()
   try:
     response = await call_next(request)
+  except Exception:
+    logger.exception(
+      "Unhandled error while processing request",
+      extra={"request_id": request_id},
+    )
+    raise
+  duration_ms = round((time.perf_counter() - start) * 1000, 2)
   logger.info(
     "Request finished",
     extra={
@@ -117,8 +174,6 @@ async def request_context(request: Request, call_next):  # noqa: D401
       "duration_ms": duration_ms,
     },
   )
-      extra={"request_id": request_id},
-    )
   response.headers["x-request-id"] = request_id
   return response
 
@@ -128,48 +183,121 @@ async def health(request: Request):
   return {"status": "ok", "request_id": request.state.request_id}
 
 
-def _extract_plain_text(path: Path) -> str:
-  if not path.exists():
-    raise FileNotFoundError(f"Missing file: {path}")
+def _stat_file(path: Path) -> os.stat_result:
+  try:
+    return path.stat()
+  except FileNotFoundError:
+    raise FileNotFoundError(f"Missing file: {path}") from None
+
+
+def _extract_plain_text(path: Path, stat: os.stat_result | None = None) -> tuple[int, str]:
+  # Reject by extension before touching the filesystem; the cache-key stat doubles as the existence check
+  if path.suffix.lower() not in SUPPORTED_SUFFIXES:
+    raise ValueError(f"Unsupported format for lightweight converter: {path.suffix}")
 
-  if path.suffix.lower() in SUPPORTED_SUFFIXES:
-    return path.read_text(encoding="utf-8", errors="ignore")
+  if stat is None:
+    stat = _stat_file(path)
+  return _cached_extract(str(path), stat.st_mtime_ns, stat.st_size)
 
-  raise ValueError(f"Unsupported format for lightweight converter: {path.suffix}")
 
+@lru_cache(maxsize=settings.cache_size)
+def _cached_extract(path: str, mtime_ns: int, size: int) -> tuple[int, str]:
+  # mtime_ns and size are only part of the key: a rewritten file misses and is read again
+  # Only the preview is kept; the rest is decoded chunk by chunk just to count characters
+  with open(path, encoding="utf-8", errors="ignore") as handle:
+    preview = handle.read(PREVIEW_CHARS)
+    length = len(preview)
+    while chunk := handle.read(READ_CHUNK_CHARS):
+      length += len(chunk)
 
-@app.post("/convert")
+  return length, preview
+
+
+async def _extract_plain_text_async(path: Path) -> tuple[int, str]:
+  # Unsupported suffixes are rejected before any I/O, so they never need a stat or a thread
+  if path.suffix.lower() not in SUPPORTED_SUFFIXES:
+    return _extract_plain_text(path)
+
+  # One stat per file: it picks inline vs thread and is reused as the cache key.
+  # For files of a few KB the thread hand-off costs more than the read itself.
+  # FIFOs and devices report size 0 but can block forever, so only regular files run inline.
+  stat = _stat_file(path)
+  if S_ISREG(stat.st_mode) and stat.st_size < settings.sync_read_threshold:
+    return _extract_plain_text(path, stat)
+  return await asyncio.to_thread(_extract_plain_text, path, stat)
+
+
+@app.delete("/cache")
+async def clear_cache(request: Request):
+  _cached_extract.cache_clear()
+  return {"status": "cleared", "request_id": request.state.request_id}
+
+
+def _conversion_result(file_path: Path, extraction: tuple[int, str] | BaseException, request_id: str) -> ConversionResult:
+  try:
+    if isinstance(extraction, BaseException):
+      raise extraction
+    length, preview = extraction
+    return ConversionResult(
+      file=file_path,
+      status="ok",
+      content={
+        "path": str(file_path),
+        "length": length,
+        "preview": preview,
+      },
+    )
+  except FileNotFoundError as missing:
+    logger.warning("File not found", extra={"request_id": request_id, "file": str(file_path)})
+    return ConversionResult(file=file_path, status="error", message=str(missing))
+  except ValueError as exc:
+    logger.warning("Unsupported format", extra={"request_id": request_id, "file": str(file_path)})
+    return ConversionResult(file=file_path, status="error", message=str(exc))
+  except Exception as exc:  # noqa: BLE001
+    logger.exception("Failed to convert file", extra={"request_id": request_id, "file": str(file_path)})
+    return ConversionResult(file=file_path, status="error", message=str(exc))
+
+
+@app.post("/convert", response_model=ConvertResponse)
 async def convert(request: ConvertRequest, http_request: Request):
   if not request.files:
     raise HTTPException(status_code=400, detail="No files supplied for conversion")
 
-  results: List[ConversionResult] = []
+  request_id = http_request.state.request_id
 
-  for file_path in request.files:
+  # Read every file concurrently; results keep request order
+  extractions = await asyncio.gather(
+    *(_extract_plain_text_async(file_path) for file_path in request.files),
+    return_exceptions=True,
+  )
+  results = [
+    _conversion_result(file_path, extraction, request_id)
+    for file_path, extraction in zip(request.files, extractions)
+  ]
+
+  return ConvertResponse(request_id=request_id, results=results)
+
+
+@app.post("/convert/stream")
+async def convert_stream(request: ConvertRequest, http_request: Request):
+  if not request.files:
+    raise HTTPException(status_code=400, detail="No files supplied for conversion")
+
+  request_id = http_request.state.request_id
+
+  async def extract(file_path: Path):
     try:
-      content = await asyncio.to_thread(_extract_plain_text, file_path)
-      results.append(
-        ConversionResult(
-          file=file_path,
-          status="ok",
-          content={
-            "path": str(file_path),
-            "length": len(content),
-            "preview": content[:400],
-          },
-        )
-      )
-    except FileNotFoundError as missing:
-      logger.warning("File not found", extra={"request_id": http_request.state.request_id, "file": str(file_path)})
-      results.append(ConversionResult(file=file_path, status="error", message=str(missing)))
-    except ValueError as exc:
-      logger.warning("Unsupported format", extra={"request_id": http_request.state.request_id, "file": str(file_path)})
-      results.append(ConversionResult(file=file_path, status="error", message=str(exc)))
+      return file_path, await _extract_plain_text_async(file_path)
     except Exception as exc:  # noqa: BLE001
-      logger.exception("Failed to convert file", extra={"request_id": http_request.state.request_id, "file": str(file_path)})
-      return {"request_id": http_request.state.request_id, "results": [item.model_dump() for item in results]}
+      return file_path, exc
+
+  # One NDJSON line per file in completion order, so the first result is sent as soon as it is ready
+  async def stream():
+    for next_done in asyncio.as_completed([extract(file_path) for file_path in request.files]):
+      file_path, extraction = await next_done
+      yield _conversion_result(file_path, extraction, request_id).model_dump_json() + "\n"
 
-  return {"request_id": http_request.state.request_id, "results": [json.loads(item.json()) for item in results]}
+  return StreamingResponse(stream(), media_type="application/x-ndjson")
 
 
 def main():
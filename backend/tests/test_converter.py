@@ -213,6 +213,40 @@ class TestContentNormalizer:
 
         assert len(result) == 2
 
+    def test_parallel_normalization_matches_serial(self, monkeypatch):
+        """Test that worker processes produce the same blocks as the serial path."""
+        import converter
+        monkeypatch.setattr(converter, 'PARALLEL_NORMALIZE_MIN_BLOCKS', 1)
+
+        def make_blocks():
+            return [
+                ContentBlock(type=ContentType.HEADING.value, content="CHAPTER 1 Introduction", level=1),
+                ContentBlock(type=ContentType.PARAGRAPH.value, content="See https://example.com.",
+                             metadata={'urls': ['https://example.com.']}),
+                ContentBlock(type=ContentType.PARAGRAPH.value, content="Again https://example.com",
+                             metadata={'urls': ['https://example.com']}),
+                ContentBlock(type=ContentType.CODE_BLOCK.value, content="$ sudo apt-get update"),
+                ContentBlock(type=ContentType.HEADING.value, content="CHAPTER 1 Introduction", level=1),
+            ]
+
+        serial = ContentNormalizer().normalize_content_blocks(make_blocks())
+        parallel = ContentNormalizer(workers=2).normalize_content_blocks(make_blocks())
+
+        assert [b.to_dict() for b in parallel] == [b.to_dict() for b in serial]
+        assert parallel[1].metadata['urls'] == ['https://example.com']
+
+    def test_url_cache_is_bounded(self, normalizer, monkeypatch):
+        """Test that the URL cache evicts the least recently seen URL."""
+        import converter
+        monkeypatch.setattr(converter, 'URL_CACHE_MAX_ENTRIES', 2)
+
+        for urls in (['https://a.com', 'https://b.com'], ['https://a.com'], ['https://c.com']):
+            block = ContentBlock(type=ContentType.PARAGRAPH.value, content="links",
+                                 metadata={'urls': list(urls)})
+            normalizer._filter_seen_urls(block)
+
+        assert list(normalizer.url_cache) == ['https://a.com', 'https://c.com']
+
 
 class TestDocumentParser:
     """Tests for DocumentParser class."""
@@ -240,6 +274,28 @@ class TestDocumentParser:
         assert 'version' in result
         assert result['version'] == __version__
 
+    def test_parallel_sections_match_serial(self, monkeypatch):
+        """Test that worker processes classify sections like the serial path."""
+        import converter
+        monkeypatch.setattr(converter, 'PARALLEL_SECTION_MIN_SECTIONS', 1)
+        text = "# Heading\n\nA paragraph.\n\n- one\n- two\n\n$ ls -la\n\n| a | b |\n|---|---|"
+
+        serial = DocumentParser(language='en')._process_sections(text.split('\n\n'))
+        parallel = DocumentParser(language='en', workers=2)._process_sections(text.split('\n\n'))
+
+        assert [[b.to_dict() for b in blocks] for blocks in parallel] == \
+            [[b.to_dict() for b in blocks] for blocks in serial]
+
+    def test_parse_parts_matches_joined_text(self, parser):
+        """Test that parsing extractor parts equals parsing their blank-line join."""
+        parts = ["# Title\n\nIntro para-\ngraph text.", "  \n- one\n- two", "Closing “words” here."]
+
+        joined = parser.parse('\n\n'.join(parts))
+        streamed = parser.parse_parts(parts)
+
+        assert streamed['content_blocks'] == joined['content_blocks']
+        assert streamed['metadata']['word_count'] == joined['metadata']['word_count']
+
     def test_parse_with_code_block(self, parser):
         """Test parsing text with code block."""
         text = "# Example\n\n```python\nprint('hello')\n```"
@@ -301,6 +357,28 @@ class TestDocumentParser:
         numbered_list = "1. First\n2. Second\n3. Third"
         assert parser._is_list(numbered_list) == True
 
+        assert parser._is_list("Plain line\nAnother plain line") == False
+
+    def test_is_table(self, parser):
+        """Test table detection."""
+        table = "| Name | Value |\n|------|-------|\n| a | 1 |"
+        assert parser._is_table(table) == True
+
+        assert parser._is_table("Not a table\nat all") == False
+
+    def test_classify_section(self, parser):
+        """Test fused section classification follows the _is_* priority order."""
+        assert parser._classify_section("# Heading") is ContentType.HEADING
+        code = "def main():\n    print('hello, world')\n    return compute_the_answer(42, verbose=True)"
+        assert parser._classify_section(code) is ContentType.CODE_BLOCK
+        items = "- First item in the list\n- Second item in the list\n- Third item in the list."
+        assert parser._classify_section(items) is ContentType.LIST
+        table = "| Name | Value |\n|------|-------|\n| alpha | 1 |\n| beta | 2 |\n| gamma | 3 |\n| delta | 4 |"
+        assert parser._classify_section(table) is ContentType.TABLE
+        assert parser._classify_section(
+            "This sentence is long enough that it cannot be mistaken for a heading at all."
+        ) is ContentType.PARAGRAPH
+
     def test_extract_key_topics(self, parser):
         """Test key topic extraction."""
         text = "Python programming Python code Python development"
@@ -341,6 +419,13 @@ class TestDocumentConverter:
         assert converter.output_dir.exists()
         assert converter.parser is not None
 
+    def test_workers_reach_parser_and_normalizer(self, temp_dir):
+        """Test that the converter's worker count is used for parsing and normalization."""
+        converter = DocumentConverter(output_dir=temp_dir, language='en', workers=3)
+
+        assert converter.parser.workers == 3
+        assert converter.parser.normalizer.workers == 3
+
     def test_supported_formats(self, converter):
         """Test that all expected formats are supported."""
         formats = converter.SUPPORTED_FORMATS
@@ -399,6 +484,23 @@ class TestDocumentConverter:
         assert 'content_blocks' in data
         assert data['metadata']['source_file'] == "test.txt"
 
+    def test_parallel_conversion_matches_serial(self, temp_dir):
+        """Test that a large document converts the same way with worker processes."""
+        from converter import PARALLEL_SECTION_MIN_SECTIONS
+        test_file = Path(temp_dir) / "large.txt"
+        sections = [f"# Heading {i}\n\nParagraph number {i} of the text.\n\n- item {i}\n- item {i + 1}\n\n$ ls -la dir{i}"
+                    for i in range(PARALLEL_SECTION_MIN_SECTIONS // 4 + 1)]
+        test_file.write_text('\n\n'.join(sections))
+
+        outputs = []
+        for workers in (1, 2):
+            output_dir = Path(temp_dir) / f"workers-{workers}"
+            result = DocumentConverter(output_dir=output_dir, language='en', workers=workers).convert_file(test_file)
+            with open(result) as f:
+                outputs.append(json.load(f)['content_blocks'])
+
+        assert outputs[0] == outputs[1]
+
     def test_convert_nonexistent_file(self, converter):
         """Test converting a non-existent file returns None."""
         result = converter.convert_file(Path("/nonexistent/file.txt"))
@@ -1,11 +1,23 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from backend.server import Settings, app
 
-from backend.server import app
 
-client = TestClient(app)
+@pytest.fixture(scope='module')
+def client():
+  # Entering the client runs the app lifespan once for the whole module
+  with TestClient(app) as test_client:
+    yield test_client
 
 
-def test_health_endpoint():
+def test_health_endpoint(client):
   response = client.get('/health')
   assert response.status_code == 200
   payload = response.json()
@@ -13,13 +25,28 @@ def test_health_endpoint():
   assert 'request_id' in payload
 
 
-def test_rejects_relative_paths():
+@pytest.mark.parametrize(
+  ('variable', 'value'),
+  [
+    ('DOCUMANCER_THREAD_POOL_SIZE', '0'),
+    ('DOCUMANCER_THREAD_POOL_SIZE', 'many'),
+    ('DOCUMANCER_CACHE_SIZE', '-1'),
+  ],
+)
+def test_rejects_invalid_sizes(monkeypatch, variable, value):
+  monkeypatch.setenv(variable, value)
+
+  with pytest.raises(ValidationError):
+    Settings()
+
+
+def test_rejects_relative_paths(client):
   response = client.post('/convert', json={'files': ['relative/path.txt']})
 
   assert response.status_code == 422
 
 
-def test_convert_unsupported_file(tmp_path):
+def test_convert_unsupported_file(client, tmp_path):
   unsupported = tmp_path / 'sample.pdf'
   unsupported.write_text('fake content')
 
@@ -31,7 +58,7 @@ def test_convert_unsupported_file(tmp_path):
   assert 'Unsupported format' in payload['results'][0]['message']
 
 
-def test_convert_text_file(tmp_path):
+def test_convert_text_file(client, tmp_path):
   text_file = tmp_path / 'sample.txt'
   text_file.write_text('hello world')
 
@@ -44,3 +71,78 @@ def test_convert_text_file(tmp_path):
   assert result['status'] == 'ok'
   assert result['content']['length'] == 11
   assert 'hello world' in result['content']['preview']
+
+
+def test_convert_continues_after_unexpected_error(client, tmp_path, monkeypatch):
+  from backend import server
+
+  broken = tmp_path / 'broken.txt'
+  broken.write_text('boom')
+  text_file = tmp_path / 'sample.txt'
+  text_file.write_text('hello world')
+  extract = server._extract_plain_text
+
+  def flaky_extract(path, stat=None):
+    if path.name == 'broken.txt':
+      raise RuntimeError('disk on fire')
+    return extract(path, stat)
+
+  monkeypatch.setattr(server, '_extract_plain_text', flaky_extract)
+  response = client.post('/convert', json={'files': [str(broken), str(text_file)]})
+  results = response.json()['results']
+
+  assert response.status_code == 200
+  assert [result['status'] for result in results] == ['error', 'ok']
+  assert results[0]['message'] == 'disk on fire'
+
+
+def test_convert_rereads_modified_file(client, tmp_path):
+  text_file = tmp_path / 'sample.txt'
+  text_file.write_text('hello world')
+  client.post('/convert', json={'files': [str(text_file)]})
+
+  text_file.write_text('hello again, world')
+  response = client.post('/convert', json={'files': [str(text_file)]})
+
+  assert response.json()['results'][0]['content']['length'] == 18
+  assert client.delete('/cache').json()['status'] == 'cleared'
+
+
+def test_convert_stream_emits_one_line_per_file(client, tmp_path):
+  text_file = tmp_path / 'sample.txt'
+  text_file.write_text('hello world')
+  unsupported = tmp_path / 'sample.pdf'
+  unsupported.write_text('fake content')
+
+  response = client.post('/convert/stream', json={'files': [str(text_file), str(unsupported)]})
+  results = {Path(line['file']).name: line for line in map(json.loads, response.text.splitlines())}
+
+  assert response.status_code == 200
+  assert response.headers['content-type'] == 'application/x-ndjson'
+  assert results['sample.txt']['content']['length'] == 11
+  assert results['sample.pdf']['status'] == 'error'
+
+
+def test_extract_sends_non_regular_files_to_a_thread(tmp_path, monkeypatch):
+  from backend import server
+
+  device = tmp_path / 'device.txt'
+  device.symlink_to(os.devnull)
+  to_thread = server.asyncio.to_thread
+  dispatched = []
+
+  async def spy(func, *args):
+    dispatched.append(args[0])
+    return await to_thread(func, *args)
+
+  monkeypatch.setattr(server.asyncio, 'to_thread', spy)
+
+  assert asyncio.run(server._extract_plain_text_async(device)) == (0, '')
+  assert dispatched == [device]
+
+
+def test_extract_reports_missing_file(tmp_path):
+  from backend import server
+
+  with pytest.raises(FileNotFoundError, match='Missing file'):
+    asyncio.run(server._extract_plain_text_async(tmp_path / 'gone.txt'))